@@ -11,7 +11,7 @@ CO-STAR Framework Components:
 
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from langchain_core.prompts import ChatPromptTemplate
 import logging
 
@@ -30,6 +30,7 @@ class COSTARPromptLoader:
         config_dir = Path(__file__).parent / "config"
         self.prompts_file = config_dir / prompts_file
         self._prompts = None
+        self._compiled: Dict[Tuple[str, str], ChatPromptTemplate] = {}
         
     @property
     def prompts(self) -> Dict:
@@ -63,6 +64,10 @@ class COSTARPromptLoader:
         Returns:
             ChatPromptTemplate with COSTAR structure
         """
+        cached = self._compiled.get((agent_name, prompt_name))
+        if cached is not None:
+            return cached
+
         try:
             agent_prompts = self.prompts[agent_name]
             prompt_config = agent_prompts[prompt_name]
@@ -74,10 +79,12 @@ class COSTARPromptLoader:
         system_message = self._build_costar_system_message(prompt_config)
         human_message = prompt_config.get('objective', '{input}')
         
-        return ChatPromptTemplate.from_messages([
+        template = ChatPromptTemplate.from_messages([
             ("system", system_message),
             ("human", human_message)
         ])
+        self._compiled[(agent_name, prompt_name)] = template
+        return template
     
     def _build_costar_system_message(self, config: Dict[str, Any]) -> str:
         """Build a comprehensive system message using COSTAR framework.
@@ -7,12 +7,20 @@ pattern of direct tool and prompt access.
 """
 
 from typing import Dict, Any, List, Optional
+import asyncio
+import heapq
 import time
 from datetime import datetime
 import logging
 import os
+import weakref
 from dateutil import parser as date_parser
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import StrOutputParser, JsonOutputParser
 
@@ -44,6 +52,10 @@ from .visualization_tools import NewsletterVisualizer
 # Initialize logger first (before using it)
 logger = logging.getLogger(__name__)
 
+# Upper bound on relevance-scoring LLM calls in flight per event loop,
+# shared by every topic a workflow fetches
+MAX_CONCURRENT_RELEVANCE_CALLS = 5
+
 # Import Phoenix observability
 try:
     from .observability import phoenix_observer, trace_node
@@ -78,6 +90,9 @@ class WorkflowNodesV2:
         self.temperature = temperature
         self._llm = None  # Will be initialized on first use
 
+        # One relevance-call limiter per event loop (semaphores are loop-bound)
+        self._relevance_limits = weakref.WeakKeyDictionary()
+
         # Initialize tools
         self.news_tool = NewsSearchTool()
         self.doc_processor = DocumentProcessor()
@@ -113,6 +128,11 @@ class WorkflowNodesV2:
             logger.info(f"LLM initialized: {self.model}")
         return self._llm
 
+    @llm.setter
+    def llm(self, value):
+        """Use a pre-built chat model (e.g. a test double) instead of ChatOpenAI."""
+        self._llm = value
+
     @trace_node("initializer")
     def initialize_workflow(self, state: dict) -> dict:
         """
@@ -130,9 +150,11 @@ class WorkflowNodesV2:
         try:
             logger.info("Initializing workflow")
 
-            # Load topics configuration
-            topics_path = state.get("topics_path", "src/ai_news_langgraph/config/tasks.yaml")
-            topics_config = self._load_topics_config(topics_path)
+            # Load topics configuration unless the caller already did
+            topics_config = state.get("topics_config")
+            if not topics_config:
+                topics_path = state.get("topics_path", "src/ai_news_langgraph/config/tasks.yaml")
+                topics_config = self.load_topics_config(topics_path)
 
             state["topics_config"] = topics_config
             state["main_topic"] = topics_config.get("main_topic", "AI in Cancer Care")
@@ -202,11 +224,18 @@ class WorkflowNodesV2:
             # Search for articles
             articles_data = self.news_tool.search(query, max_results=15)
 
-            # Score articles using direct prompt
-            articles = []
-            for article_data in articles_data:
-                relevance = await self._analyze_relevance(article_data, current_topic)
+            # Score articles concurrently (each score is an independent LLM
+            # call), with at most MAX_CONCURRENT_RELEVANCE_CALLS in flight
+            limit = self._relevance_limit()
 
+            async def score(article_data: Dict[str, Any]) -> float:
+                async with limit:
+                    return await self._analyze_relevance(article_data, current_topic)
+
+            relevances = await asyncio.gather(*(score(article_data) for article_data in articles_data))
+
+            articles = []
+            for article_data, relevance in zip(articles_data, relevances):
                 # Handle invalid published_date formats gracefully
                 published_date_value = None
                 raw_date = article_data.get("published_date")
@@ -253,9 +282,8 @@ class WorkflowNodesV2:
                     )
                     articles.append(article)
 
-            # Sort by relevance
-            articles.sort(key=lambda x: x.relevance_score or 0, reverse=True)
-            top_articles = articles[:10]
+            # Keep the 10 most relevant articles
+            top_articles = heapq.nlargest(10, articles, key=lambda x: x.relevance_score or 0)
 
             # Create topic result as dict
             topic_result = {
@@ -297,6 +325,14 @@ class WorkflowNodesV2:
             state["errors"].append(f"Failed to fetch news: {str(e)}")
             return state
 
+    def _relevance_limit(self) -> asyncio.Semaphore:
+        """Semaphore bounding relevance calls on the running event loop."""
+        loop = asyncio.get_running_loop()
+        limit = self._relevance_limits.get(loop)
+        if limit is None:
+            limit = self._relevance_limits[loop] = asyncio.Semaphore(MAX_CONCURRENT_RELEVANCE_CALLS)
+        return limit
+
     async def _generate_search_query(self, topic: Dict[str, Any]) -> str:
         """Generate optimized search query for a topic."""
         if topic.get("query"):
@@ -1230,7 +1266,7 @@ class WorkflowNodesV2:
                 logger.error(f"Error handling error: {inner_e}")
                 return state
 
-    def _load_topics_config(self, config_path: Optional[str]) -> Dict[str, Any]:
+    def load_topics_config(self, config_path: Optional[str]) -> Dict[str, Any]:
         """Load topics configuration from file."""
         import yaml
         import json
@@ -1246,10 +1282,12 @@ class WorkflowNodesV2:
             path_to_load = config_path or default_path
             logger.info(f"Loading topics configuration from: {path_to_load}")
 
-            with open(path_to_load, "r") as f:
-                if path_to_load.endswith('.json'):
-                    data = json.load(f)
-                else:
+            if path_to_load.endswith('.json'):
+                with open(path_to_load, "rb") as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+            else:
+                with open(path_to_load, "r") as f:
                     # For YAML files, extract topics section
                     yaml_data = yaml.safe_load(f)
                     # If it's tasks.yaml with nested structure
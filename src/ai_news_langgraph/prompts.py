@@ -5,13 +5,22 @@ This module provides structured prompt templates and management
 for all agents in the workflow, implementing direct access patterns.
 """
 
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple, Union, IO
+from dataclasses import dataclass, replace
+import functools
+import json
+import os
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
 from langchain_core.prompts.prompt import PromptTemplate
 import yaml
 from pathlib import Path
 
+# Use the libyaml-backed loader when it is available
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 @dataclass
 class PromptConfig:
@@ -25,6 +34,15 @@ class PromptConfig:
     examples: Optional[List[Dict[str, Any]]] = None
 
 
+def _copy_config(config: PromptConfig) -> PromptConfig:
+    """Copy a prompt config, including its variable and example lists."""
+    return replace(
+        config,
+        variables=list(config.variables),
+        examples=[dict(example) for example in config.examples] if config.examples is not None else None
+    )
+
+
 class PromptRegistry:
     """
     Centralized registry for all prompt templates.
@@ -33,26 +51,159 @@ class PromptRegistry:
 
     def __init__(self):
         """Initialize the prompt registry."""
-        self._prompts: Dict[str, Dict[str, PromptConfig]] = {}
-        self._compiled_prompts: Dict[str, ChatPromptTemplate] = {}
-
-        # Load default prompts
-        self._load_default_prompts()
-
-    def _load_default_prompts(self) -> None:
-        """Load and register default prompt templates."""
-
-        # Research Agent Prompts
-        self.register_prompt(
-            "research_agent",
-            "analyze_relevance",
-            PromptConfig(
-                name="analyze_relevance",
-                description="Analyze article relevance to topic",
-                system_template="""You are an AI Research Analyst specializing in cancer care and medical AI applications.
+        # Default prompts are built and compiled once per process; each
+        # registry gets its own configs so edits stay local to it
+        default_prompts, default_compiled = _default_prompts()
+        self._prompts: Dict[str, Dict[str, PromptConfig]] = {
+            agent_name: {name: _copy_config(config) for name, config in prompts.items()}
+            for agent_name, prompts in default_prompts.items()
+        }
+        self._compiled_prompts: Dict[Tuple[str, str], ChatPromptTemplate] = dict(default_compiled)
+
+    def register_prompt(
+        self,
+        agent_name: str,
+        prompt_name: str,
+        config: PromptConfig
+    ) -> None:
+        """
+        Register a new prompt template.
+
+        Args:
+            agent_name: Name of the agent
+            prompt_name: Name of the prompt
+            config: Prompt configuration
+        """
+        # Compile up front so template errors surface at registration
+        compiled = self._compile_prompt(config)
+
+        if agent_name not in self._prompts:
+            self._prompts[agent_name] = {}
+
+        self._prompts[agent_name][prompt_name] = config
+        self._compiled_prompts[(agent_name, prompt_name)] = compiled
+
+    @staticmethod
+    def _compile_prompt(config: PromptConfig) -> ChatPromptTemplate:
+        """Compile a prompt configuration into a ChatPromptTemplate."""
+        messages = []
+
+        # Add system message
+        if config.system_template:
+            messages.append(SystemMessagePromptTemplate.from_template(config.system_template))
+
+        # Add human message
+        messages.append(HumanMessagePromptTemplate.from_template(config.human_template))
+
+        return ChatPromptTemplate.from_messages(messages)
+
+    def get_prompt(self, agent_name: str, prompt_name: str) -> ChatPromptTemplate:
+        """
+        Get a compiled prompt template.
+
+        Args:
+            agent_name: Name of the agent
+            prompt_name: Name of the prompt
+
+        Returns:
+            Compiled ChatPromptTemplate
+        """
+        try:
+            return self._compiled_prompts[(agent_name, prompt_name)]
+        except KeyError:
+            raise ValueError(f"Prompt {agent_name}.{prompt_name} not found in registry") from None
+
+    def get_prompt_config(self, agent_name: str, prompt_name: str) -> PromptConfig:
+        """
+        Get the configuration for a prompt.
+
+        Args:
+            agent_name: Name of the agent
+            prompt_name: Name of the prompt
+
+        Returns:
+            PromptConfig object
+        """
+        if agent_name not in self._prompts or prompt_name not in self._prompts[agent_name]:
+            raise ValueError(f"Prompt config {agent_name}.{prompt_name} not found")
+
+        return self._prompts[agent_name][prompt_name]
+
+    def list_prompts(self, agent_name: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        List available prompts.
+
+        Args:
+            agent_name: Optional filter by agent name
+
+        Returns:
+            Dictionary of agent names to prompt lists
+        """
+        if agent_name:
+            return {agent_name: list(self._prompts.get(agent_name, {}).keys())}
+
+        return {
+            agent: list(prompts.keys())
+            for agent, prompts in self._prompts.items()
+        }
+
+    def load_from_yaml(self, yaml_path: Union[str, os.PathLike, IO[str]]) -> None:
+        """
+        Load prompts from a YAML file.
+
+        Files ending in .json are parsed with the json module.
+
+        Args:
+            yaml_path: Path to YAML or JSON file, or an open text stream
+        """
+        if hasattr(yaml_path, 'read'):
+            data = yaml.load(yaml_path, Loader=_SafeLoader)
+        else:
+            path = Path(yaml_path)
+            if not path.exists():
+                raise FileNotFoundError(f"Prompt file not found: {yaml_path}")
+
+            with open(path, 'r') as f:
+                if path.suffix == '.json':
+                    data = json.load(f)
+                else:
+                    data = yaml.load(f, Loader=_SafeLoader)
+
+        for agent_name, prompts in data.items():
+            if agent_name.startswith('#'):  # Skip comments
+                continue
+
+            for prompt_name, prompt_data in prompts.items():
+                config = PromptConfig(
+                    name=prompt_name,
+                    description=prompt_data.get('description', ''),
+                    system_template=prompt_data.get('system', ''),
+                    human_template=prompt_data.get('human', ''),
+                    variables=prompt_data.get('variables', []),
+                    output_format=prompt_data.get('output_format'),
+                    examples=prompt_data.get('examples')
+                )
+                self.register_prompt(agent_name, prompt_name, config)
+
+
+def _default_prompt_configs() -> Dict[str, Dict[str, PromptConfig]]:
+    """Build the default prompt configs, keyed by agent and prompt name."""
+    prompts: Dict[str, Dict[str, PromptConfig]] = {}
+
+    def register(agent_name: str, prompt_name: str, config: PromptConfig) -> None:
+        prompts.setdefault(agent_name, {})[prompt_name] = config
+
+    # Research Agent Prompts
+    register(
+        "research_agent",
+        "analyze_relevance",
+        PromptConfig(
+            name="analyze_relevance",
+            description="Analyze article relevance to topic",
+            system_template="""You are an AI Research Analyst specializing in cancer care and medical AI applications.
 Your role is to assess the relevance and quality of articles for inclusion in a specialized newsletter.
 You have deep expertise in oncology, AI/ML applications in healthcare, and research methodology.""",
-                human_template="""Analyze the relevance of this article to the specified topic.
+            human_template="""Analyze the relevance of this article to the specified topic.
 
 Topic: {topic_name}
 Topic Description: {topic_description}
@@ -68,20 +219,20 @@ Scoring Criteria:
 
 Provide a relevance score between 0.0 and 1.0.
 Output only the numerical score, nothing else.""",
-                variables=["topic_name", "topic_description", "title", "content"],
-                output_format="float"
-            )
+            variables=["topic_name", "topic_description", "title", "content"],
+            output_format="float"
         )
-
-        self.register_prompt(
-            "research_agent",
-            "extract_key_facts",
-            PromptConfig(
-                name="extract_key_facts",
-                description="Extract key facts from article",
-                system_template="""You are an expert at analyzing medical and AI research content.
+    )
+
+    register(
+        "research_agent",
+        "extract_key_facts",
+        PromptConfig(
+            name="extract_key_facts",
+            description="Extract key facts from article",
+            system_template="""You are an expert at analyzing medical and AI research content.
 Your task is to extract the most important facts and findings from articles.""",
-                human_template="""Extract the key facts from this article:
+            human_template="""Extract the key facts from this article:
 
 Title: {title}
 Content: {content}
@@ -94,22 +245,22 @@ Provide:
 5. Timeline or next steps
 
 Format as a structured list.""",
-                variables=["title", "content"],
-                output_format="structured_list"
-            )
+            variables=["title", "content"],
+            output_format="structured_list"
         )
-
-        # Editor Agent Prompts
-        self.register_prompt(
-            "editor_agent",
-            "summarize_topic",
-            PromptConfig(
-                name="summarize_topic",
-                description="Create comprehensive topic summary",
-                system_template="""You are a Senior Medical Editor with expertise in AI applications in oncology.
+    )
+
+    # Editor Agent Prompts
+    register(
+        "editor_agent",
+        "summarize_topic",
+        PromptConfig(
+            name="summarize_topic",
+            description="Create comprehensive topic summary",
+            system_template="""You are a Senior Medical Editor with expertise in AI applications in oncology.
 Your writing is clear, engaging, and accessible to healthcare professionals while maintaining scientific accuracy.
 You excel at synthesizing complex information into coherent narratives.""",
-                human_template="""Create a comprehensive summary for the following topic and articles.
+            human_template="""Create a comprehensive summary for the following topic and articles.
 
 Topic: {topic_name}
 Description: {topic_description}
@@ -135,21 +286,21 @@ Briefly describe the potential impact on cancer care.
 Select the top 3 most important articles with brief explanations why.
 
 Ensure the content is professional, informative, and engaging.""",
-                variables=["topic_name", "topic_description", "articles_json"],
-                output_format="markdown"
-            )
+            variables=["topic_name", "topic_description", "articles_json"],
+            output_format="markdown"
         )
-
-        self.register_prompt(
-            "editor_agent",
-            "create_executive_summary",
-            PromptConfig(
-                name="create_executive_summary",
-                description="Create newsletter executive summary",
-                system_template="""You are the Executive Editor of a premier AI in Cancer Care newsletter.
+    )
+
+    register(
+        "editor_agent",
+        "create_executive_summary",
+        PromptConfig(
+            name="create_executive_summary",
+            description="Create newsletter executive summary",
+            system_template="""You are the Executive Editor of a premier AI in Cancer Care newsletter.
 You have the ability to identify the most impactful developments and communicate them effectively
 to an audience of oncologists, researchers, and healthcare executives.""",
-                human_template="""Create an executive summary for this week's AI in Cancer Care newsletter.
+            human_template="""Create an executive summary for this week's AI in Cancer Care newsletter.
 
 Topics covered this week:
 {topics_summaries}
@@ -161,22 +312,22 @@ Write a compelling 250-300 word executive summary that:
 4. Concludes with a forward-looking statement
 
 The tone should be professional yet engaging, suitable for senior healthcare professionals.""",
-                variables=["topics_summaries"],
-                output_format="text"
-            )
+            variables=["topics_summaries"],
+            output_format="text"
         )
-
-        # Chief Editor Agent Prompts
-        self.register_prompt(
-            "chief_editor",
-            "generate_newsletter_html",
-            PromptConfig(
-                name="generate_newsletter_html",
-                description="Generate HTML newsletter",
-                system_template="""You are a Digital Content Specialist who creates professional,
+    )
+
+    # Chief Editor Agent Prompts
+    register(
+        "chief_editor",
+        "generate_newsletter_html",
+        PromptConfig(
+            name="generate_newsletter_html",
+            description="Generate HTML newsletter",
+            system_template="""You are a Digital Content Specialist who creates professional,
 mobile-responsive HTML newsletters for medical audiences. You understand both content
 presentation and technical implementation.""",
-                human_template="""Generate a professional HTML newsletter with the following content:
+            human_template="""Generate a professional HTML newsletter with the following content:
 
 Executive Summary:
 {executive_summary}
@@ -193,22 +344,22 @@ Newsletter Requirements:
 - Footer with unsubscribe link
 
 Output clean, valid HTML with inline CSS for email compatibility.""",
-                variables=["executive_summary", "topics_content"],
-                output_format="html"
-            )
+            variables=["executive_summary", "topics_content"],
+            output_format="html"
         )
-
-        # Self-Reviewer Agent Prompts (Metamorphosis Pattern)
-        self.register_prompt(
-            "self_reviewer",
-            "evaluate_quality",
-            PromptConfig(
-                name="evaluate_quality",
-                description="Evaluate content quality",
-                system_template="""You are a Quality Assurance Specialist for medical publications.
+    )
+
+    # Self-Reviewer Agent Prompts (Metamorphosis Pattern)
+    register(
+        "self_reviewer",
+        "evaluate_quality",
+        PromptConfig(
+            name="evaluate_quality",
+            description="Evaluate content quality",
+            system_template="""You are a Quality Assurance Specialist for medical publications.
 Your role is to ensure all content meets the highest standards of accuracy, clarity, and professionalism.
 You have expertise in medical writing, fact-checking, and editorial standards.""",
-                human_template="""Evaluate the quality of this content:
+            human_template="""Evaluate the quality of this content:
 
 {content}
 
@@ -234,19 +385,19 @@ Provide:
 2. Specific feedback for each criterion
 3. Recommendations for improvement
 4. Red flags or concerns (if any)""",
-                variables=["content"],
-                output_format="structured_assessment"
-            )
+            variables=["content"],
+            output_format="structured_assessment"
         )
+    )
 
-        self.register_prompt(
-            "self_reviewer",
-            "check_consistency",
-            PromptConfig(
-                name="check_consistency",
-                description="Check content consistency",
-                system_template="""You are an Editorial Consistency Checker ensuring uniformity across all content.""",
-                human_template="""Check this content for consistency issues:
+    register(
+        "self_reviewer",
+        "check_consistency",
+        PromptConfig(
+            name="check_consistency",
+            description="Check content consistency",
+            system_template="""You are an Editorial Consistency Checker ensuring uniformity across all content.""",
+            human_template="""Check this content for consistency issues:
 
 {content}
 
@@ -257,128 +408,24 @@ Review for:
 4. Reference consistency (proper citations)
 
 Report any inconsistencies found.""",
-                variables=["content"],
-                output_format="list"
-            )
+            variables=["content"],
+            output_format="list"
         )
+    )
 
-    def register_prompt(
-        self,
-        agent_name: str,
-        prompt_name: str,
-        config: PromptConfig
-    ) -> None:
-        """
-        Register a new prompt template.
-
-        Args:
-            agent_name: Name of the agent
-            prompt_name: Name of the prompt
-            config: Prompt configuration
-        """
-        if agent_name not in self._prompts:
-            self._prompts[agent_name] = {}
-
-        self._prompts[agent_name][prompt_name] = config
-
-        # Compile the prompt
-        cache_key = f"{agent_name}.{prompt_name}"
-        self._compiled_prompts[cache_key] = self._compile_prompt(config)
-
-    def _compile_prompt(self, config: PromptConfig) -> ChatPromptTemplate:
-        """Compile a prompt configuration into a ChatPromptTemplate."""
-        messages = []
-
-        # Add system message
-        if config.system_template:
-            messages.append(SystemMessagePromptTemplate.from_template(config.system_template))
-
-        # Add human message
-        messages.append(HumanMessagePromptTemplate.from_template(config.human_template))
-
-        return ChatPromptTemplate.from_messages(messages)
+    return prompts
 
-    def get_prompt(self, agent_name: str, prompt_name: str) -> ChatPromptTemplate:
-        """
-        Get a compiled prompt template.
 
-        Args:
-            agent_name: Name of the agent
-            prompt_name: Name of the prompt
-
-        Returns:
-            Compiled ChatPromptTemplate
-        """
-        cache_key = f"{agent_name}.{prompt_name}"
-
-        if cache_key not in self._compiled_prompts:
-            raise ValueError(f"Prompt {cache_key} not found in registry")
-
-        return self._compiled_prompts[cache_key]
-
-    def get_prompt_config(self, agent_name: str, prompt_name: str) -> PromptConfig:
-        """
-        Get the configuration for a prompt.
-
-        Args:
-            agent_name: Name of the agent
-            prompt_name: Name of the prompt
-
-        Returns:
-            PromptConfig object
-        """
-        if agent_name not in self._prompts or prompt_name not in self._prompts[agent_name]:
-            raise ValueError(f"Prompt config {agent_name}.{prompt_name} not found")
-
-        return self._prompts[agent_name][prompt_name]
-
-    def list_prompts(self, agent_name: Optional[str] = None) -> Dict[str, List[str]]:
-        """
-        List available prompts.
-
-        Args:
-            agent_name: Optional filter by agent name
-
-        Returns:
-            Dictionary of agent names to prompt lists
-        """
-        if agent_name:
-            return {agent_name: list(self._prompts.get(agent_name, {}).keys())}
-
-        return {
-            agent: list(prompts.keys())
-            for agent, prompts in self._prompts.items()
-        }
-
-    def load_from_yaml(self, yaml_path: str) -> None:
-        """
-        Load prompts from a YAML file.
-
-        Args:
-            yaml_path: Path to YAML file
-        """
-        path = Path(yaml_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {yaml_path}")
-
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
-
-        for agent_name, prompts in data.items():
-            if agent_name.startswith('#'):  # Skip comments
-                continue
-
-            for prompt_name, prompt_data in prompts.items():
-                config = PromptConfig(
-                    name=prompt_name,
-                    description=prompt_data.get('description', ''),
-                    system_template=prompt_data.get('system', ''),
-                    human_template=prompt_data.get('human', ''),
-                    variables=prompt_data.get('variables', []),
-                    output_format=prompt_data.get('output_format'),
-                    examples=prompt_data.get('examples')
-                )
-                self.register_prompt(agent_name, prompt_name, config)
+@functools.lru_cache(maxsize=1)
+def _default_prompts() -> Tuple[Dict[str, Dict[str, PromptConfig]], Dict[Tuple[str, str], ChatPromptTemplate]]:
+    """Build the default prompt configs and their compiled templates once."""
+    prompts = _default_prompt_configs()
+    compiled = {
+        (agent_name, prompt_name): PromptRegistry._compile_prompt(config)
+        for agent_name, agent_prompts in prompts.items()
+        for prompt_name, config in agent_prompts.items()
+    }
+    return prompts, compiled
 
 
 class PromptOptimizer:
@@ -10,7 +10,7 @@ CO-STAR Framework:
 - Response: Expected output format and structure
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
 
@@ -36,7 +36,7 @@ class CostarPromptRegistry:
     def __init__(self):
         """Initialize the CO-STAR prompt registry."""
         self._prompts: Dict[str, Dict[str, CostarPromptConfig]] = {}
-        self._compiled_prompts: Dict[str, ChatPromptTemplate] = {}
+        self._compiled_prompts: Dict[Tuple[str, str], ChatPromptTemplate] = {}
         self._load_costar_prompts()
 
     def _load_costar_prompts(self) -> None:
@@ -343,8 +343,7 @@ of the work. Focus on improvement rather than criticism.""",
         self._prompts[agent_name][prompt_name] = config
 
         # Compile into ChatPromptTemplate
-        cache_key = f"{agent_name}.{prompt_name}"
-        self._compiled_prompts[cache_key] = self._compile_costar_prompt(config)
+        self._compiled_prompts[(agent_name, prompt_name)] = self._compile_costar_prompt(config)
 
     def _compile_costar_prompt(self, config: CostarPromptConfig) -> ChatPromptTemplate:
         """Compile a CO-STAR configuration into a ChatPromptTemplate."""
@@ -365,12 +364,15 @@ of the work. Focus on improvement rather than criticism.""",
 # AUDIENCE
 {config.audience}"""
 
-        # Build human message with task and response format
-        human_template = """# TASK
-{{{' }}}\n{{'.join(config.variables)}}}
+        # Build human message with one placeholder per variable; literal
+        # braces in the response format (JSON examples) are escaped
+        task = "\n".join(f"{{{variable}}}" for variable in config.variables)
+        response_format = config.response_format.replace("{", "{{").replace("}", "}}")
+        human_template = f"""# TASK
+{task}
 
 # RESPONSE FORMAT
-{config.response_format}"""
+{response_format}"""
 
         messages = [
             SystemMessagePromptTemplate.from_template(system_template),
@@ -381,19 +383,17 @@ of the work. Focus on improvement rather than criticism.""",
 
     def get_prompt(self, agent_name: str, prompt_name: str) -> ChatPromptTemplate:
         """Get a compiled CO-STAR prompt template."""
-        cache_key = f"{agent_name}.{prompt_name}"
-
-        if cache_key not in self._compiled_prompts:
-            raise ValueError(f"Prompt {cache_key} not found in registry")
-
-        return self._compiled_prompts[cache_key]
+        try:
+            return self._compiled_prompts[(agent_name, prompt_name)]
+        except KeyError:
+            raise ValueError(f"Prompt {agent_name}.{prompt_name} not found in registry") from None
 
     def get_prompt_config(self, agent_name: str, prompt_name: str) -> CostarPromptConfig:
         """Get the CO-STAR configuration for a prompt."""
-        if agent_name not in self._prompts or prompt_name not in self._prompts[agent_name]:
-            raise ValueError(f"Prompt config {agent_name}.{prompt_name} not found")
-
-        return self._prompts[agent_name][prompt_name]
+        try:
+            return self._prompts[agent_name][prompt_name]
+        except KeyError:
+            raise ValueError(f"Prompt config {agent_name}.{prompt_name} not found") from None
 
     def list_prompts(self) -> Dict[str, List[str]]:
         """List all available CO-STAR prompts."""
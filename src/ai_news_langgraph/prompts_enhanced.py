@@ -10,11 +10,15 @@ This module provides improved prompts that include:
 - Clear response format specifications
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import yaml
 from pathlib import Path
 
+# Maximum number of rendered prompts kept per registry
+RENDER_CACHE_SIZE = 512
+
 
 @dataclass
 class FewShotExample:
@@ -163,6 +167,7 @@ class EnhancedCostarPromptRegistry:
             config_path: Path to YAML config file (optional)
         """
         self.prompts: Dict[str, EnhancedCostarPromptConfig] = {}
+        self._render_cache: "OrderedDict[Tuple, str]" = OrderedDict()
 
         if config_path and config_path.exists():
             self.load_from_yaml(config_path)
@@ -185,6 +190,9 @@ class EnhancedCostarPromptRegistry:
         with open(config_path, 'r') as f:
             config = yaml.safe_load(f)
 
+        # Rendered prompts may come from definitions being replaced
+        self._render_cache.clear()
+
         # Parse each agent's prompts
         for agent_name, agent_prompts in config.items():
             if agent_name == "metadata":  # Skip metadata section
@@ -263,14 +271,34 @@ class EnhancedCostarPromptRegistry:
         Returns:
             Rendered prompt string
         """
+        # Rendering is pure, so identical requests reuse the earlier result
+        cache_key = (agent_name, prompt_name, compact, tuple(sorted(kwargs.items())))
+        try:
+            rendered = self._render_cache.get(cache_key)
+        except TypeError:
+            # Unhashable variable values are rendered without caching
+            cache_key = None
+            rendered = None
+
+        if rendered is not None:
+            self._render_cache.move_to_end(cache_key)
+            return rendered
+
         prompt = self.get_prompt(agent_name, prompt_name)
         if not prompt:
             raise ValueError(f"Prompt not found: {agent_name}.{prompt_name}")
 
         if compact:
-            return prompt.render_compact(**kwargs)
+            rendered = prompt.render_compact(**kwargs)
         else:
-            return prompt.render(**kwargs)
+            rendered = prompt.render(**kwargs)
+
+        if cache_key is not None:
+            self._render_cache[cache_key] = rendered
+            if len(self._render_cache) > RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+
+        return rendered
 
     def list_prompts(self, agent_name: Optional[str] = None) -> List[str]:
         """
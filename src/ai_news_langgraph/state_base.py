@@ -2,12 +2,81 @@
 Base state models without LangGraph dependency for testing.
 """
 
-from typing import List, Dict, Optional, Any, Literal
+from typing import List, Dict, Deque, Optional, Any, Iterable, Literal, get_args
+from collections import deque
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from pydantic import BaseModel, Field
+import time
+from pydantic import BaseModel, Field, field_serializer, field_validator
 
+class ValidationError(ValueError):
+    """Raised when a dataclass state model rejects its input."""
 
-class ArticleModel(BaseModel):
+AgentTaskStatus = Literal["pending", "in_progress", "success", "failed", "skipped"]
+_AGENT_TASK_STATUSES = frozenset(get_args(AgentTaskStatus))
+
+__all__ = [
+    "ArticleModel",
+    "TopicSearchResultModel",
+    "TopicSummaryModel",
+    "NewsletterContentModel",
+    "AgentTaskResultModel",
+    "WorkflowStateBase",
+    "WorkflowState",
+    "ValidationError",
+    "MAX_STATE_MESSAGES",
+]
+
+
+# Most recent errors/warnings kept per state; older ones are dropped
+MAX_STATE_MESSAGES = 1000
+
+_ts_cache = (0, "")
+
+
+def _log_timestamp() -> str:
+    """Return a second-resolution ISO timestamp, reformatted at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, datetime.fromtimestamp(now).isoformat(timespec="seconds"))
+    return _ts_cache[1]
+
+
+_now_cache = (0, datetime.fromtimestamp(0))
+
+
+def _coarse_now() -> datetime:
+    """Return the current time at millisecond resolution, shared within each millisecond."""
+    global _now_cache
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _now_cache[0]:
+        _now_cache = (now_ms, datetime.fromtimestamp(now_ms / 1000))
+    return _now_cache[1]
+
+
+def _coerce_number(name: str, value: Any, kind: type) -> Any:
+    """Convert value to kind (float or int) the way pydantic's lax mode would."""
+    if type(value) is kind:
+        return value
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"{name} must be a valid {kind.__name__}, got {value!r}") from None
+
+
+def _unit_score(name: str, value: Any) -> Optional[float]:
+    """Coerce a score to float and reject it outside [0.0, 1.0]; None means unscored."""
+    if value is None:
+        return None
+    score = _coerce_number(name, value, float)
+    if not 0.0 <= score <= 1.0:
+        raise ValidationError(f"{name} must be between 0.0 and 1.0, got {score}")
+    return score
+
+
+@dataclass(slots=True, kw_only=True)
+class ArticleModel:
     """Structured article data model."""
     title: str
     url: str
@@ -15,29 +84,71 @@ class ArticleModel(BaseModel):
     content: Optional[str] = None
     summary: Optional[str] = None
     published_date: Optional[datetime] = None
-    relevance_score: Optional[float] = Field(None, ge=0.0, le=1.0)
+    relevance_score: Optional[float] = None
 
+    def __post_init__(self) -> None:
+        self.relevance_score = _unit_score("relevance_score", self.relevance_score)
 
-class TopicSearchResultModel(BaseModel):
+    @classmethod
+    def minimal(cls, title: str, url: str) -> "ArticleModel":
+        """Build an article with only a title and URL, skipping keyword handling."""
+        article = cls.__new__(cls)
+        article.title = title
+        article.url = url
+        article.source = None
+        article.content = None
+        article.summary = None
+        article.published_date = None
+        article.relevance_score = None
+        return article
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Return the fields as a dict, mirroring the pydantic API."""
+        return asdict(self)
+
+
+class _StateModel(BaseModel):
+    """Base for pydantic state models that carry no custom validators."""
+
+    @classmethod
+    def fast_create(cls, **fields: Any):
+        """
+        Build a model from trusted internal data without validating it.
+
+        Defaults are still applied. Use the normal constructor for external
+        input such as parsed LLM output.
+        """
+        return cls.model_construct(**fields)
+
+
+class TopicSearchResultModel(_StateModel):
     """Search results for a specific topic."""
     topic_name: str
     topic_description: str
     search_query: str
     articles: List[ArticleModel] = Field(default_factory=list)
-    search_timestamp: datetime = Field(default_factory=datetime.now)
+    search_timestamp: datetime = Field(default_factory=_coarse_now)
 
 
-class TopicSummaryModel(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class TopicSummaryModel:
     """Comprehensive summary for a topic."""
     topic_name: str
     overview: str
-    key_findings: List[str] = Field(default_factory=list)
-    notable_trends: List[str] = Field(default_factory=list)
-    top_articles: List[ArticleModel] = Field(default_factory=list)
-    quality_score: Optional[float] = Field(None, ge=0.0, le=1.0)
+    key_findings: List[str] = field(default_factory=list)
+    notable_trends: List[str] = field(default_factory=list)
+    top_articles: List[ArticleModel] = field(default_factory=list)
+    quality_score: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        self.quality_score = _unit_score("quality_score", self.quality_score)
 
+    def model_dump(self) -> Dict[str, Any]:
+        """Return the fields as a dict, mirroring the pydantic API."""
+        return asdict(self)
 
-class NewsletterContentModel(BaseModel):
+
+class NewsletterContentModel(_StateModel):
     """Newsletter content structure."""
     subject_line: str
     preheader: str
@@ -45,20 +156,31 @@ class NewsletterContentModel(BaseModel):
     topics: List[Dict[str, Any]]
     call_to_action: str
     footer_text: str
-    generated_at: datetime = Field(default_factory=datetime.now)
+    generated_at: datetime = Field(default_factory=_coarse_now)
 
 
-class AgentTaskResultModel(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AgentTaskResultModel:
     """Result from an agent task execution."""
     task_name: str
     agent_name: str
-    status: Literal["pending", "in_progress", "success", "failed", "skipped"]
+    status: AgentTaskStatus
     output: Optional[str] = None
     error: Optional[str] = None
     execution_time: float = 0.0
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
     retry_count: int = 0
 
+    def __post_init__(self) -> None:
+        if self.status not in _AGENT_TASK_STATUSES:
+            raise ValidationError(f"Invalid agent task status: {self.status!r}")
+        self.execution_time = _coerce_number("execution_time", self.execution_time, float)
+        self.retry_count = _coerce_number("retry_count", self.retry_count, int)
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Return the fields as a dict, mirroring the pydantic API."""
+        return asdict(self)
+
 
 class WorkflowStateBase(BaseModel):
     """
@@ -100,8 +222,8 @@ class WorkflowStateBase(BaseModel):
 
     # Tracking
     agent_results: List[AgentTaskResultModel] = Field(default_factory=list)
-    errors: List[str] = Field(default_factory=list)
-    warnings: List[str] = Field(default_factory=list)
+    errors: Deque[str] = Field(default_factory=lambda: deque(maxlen=MAX_STATE_MESSAGES))
+    warnings: Deque[str] = Field(default_factory=lambda: deque(maxlen=MAX_STATE_MESSAGES))
 
     # Metrics
     total_articles_fetched: int = 0
@@ -116,13 +238,35 @@ class WorkflowStateBase(BaseModel):
             datetime: lambda v: v.isoformat()
         }
 
+    @field_validator("errors", "warnings", mode="after")
+    @classmethod
+    def _bound_messages(cls, messages: Deque[str]) -> Deque[str]:
+        """Cap message history built from input data at MAX_STATE_MESSAGES."""
+        if messages.maxlen == MAX_STATE_MESSAGES:
+            return messages
+        return deque(messages, maxlen=MAX_STATE_MESSAGES)
+
+    @field_serializer("errors", "warnings")
+    def _serialize_messages(self, messages: Deque[str]) -> List[str]:
+        return list(messages)
+
     def add_error(self, error: str) -> None:
         """Add an error message to the state."""
-        self.errors.append(f"[{datetime.now().isoformat()}] {error}")
+        self.errors.append(f"[{_log_timestamp()}] {error}")
 
     def add_warning(self, warning: str) -> None:
         """Add a warning message to the state."""
-        self.warnings.append(f"[{datetime.now().isoformat()}] {warning}")
+        self.warnings.append(f"[{_log_timestamp()}] {warning}")
+
+    def extend_errors(self, errors: Iterable[str]) -> None:
+        """Add several error messages under a single timestamp."""
+        prefix = f"[{_log_timestamp()}]"
+        self.errors.extend(f"{prefix} {error}" for error in errors)
+
+    def extend_warnings(self, warnings: Iterable[str]) -> None:
+        """Add several warning messages under a single timestamp."""
+        prefix = f"[{_log_timestamp()}]"
+        self.warnings.extend(f"{prefix} {warning}" for warning in warnings)
 
     def add_agent_result(self, result: AgentTaskResultModel) -> None:
         """Add an agent task result to the state."""
@@ -130,7 +274,9 @@ class WorkflowStateBase(BaseModel):
 
     def get_remaining_topics(self) -> List[Dict[str, Any]]:
         """Get list of topics that haven't been processed yet."""
-        all_topics = self.topics_config.get("topics", self.topics_config.get("sub_topics", []))
+        all_topics = self.topics_config.get("topics")
+        if all_topics is None:
+            all_topics = self.topics_config.get("sub_topics", [])
         return all_topics[self.current_topic_index:]
 
     def is_complete(self) -> bool:
@@ -144,10 +290,18 @@ class WorkflowStateBase(BaseModel):
         else:
             duration = (datetime.now() - self.workflow_start_time).total_seconds()
 
+        success_count = failed_count = 0
+        for result in self.agent_results:
+            if result.status == "success":
+                success_count += 1
+            elif result.status == "failed":
+                failed_count += 1
+
         return {
             "total_articles": self.total_articles_fetched,
             "topics_processed": self.total_topics_processed,
-            "success_rate": sum(1 for r in self.agent_results if r.status == "success") / max(len(self.agent_results), 1),
+            "success_rate": success_count / max(len(self.agent_results), 1),
+            "failed_tasks": failed_count,
             "duration_seconds": duration,
             "errors_count": len(self.errors),
             "warnings_count": len(self.warnings)
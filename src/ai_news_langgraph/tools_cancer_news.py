@@ -5,7 +5,9 @@ This module provides targeted search capabilities for cancer-related AI research
 from authoritative medical and scientific sources.
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
 import requests
 from datetime import datetime, timedelta
@@ -105,46 +107,19 @@ class CancerNewsAPI:
 
         print(f"\n🔬 Searching cancer-specific sources for: {query[:60]}...")
 
-        # Search PubMed
-        try:
-            pubmed_results = self._search_pubmed(query, max_results_per_source, days_back)
-            all_results.extend(pubmed_results)
-            print(f"   ✅ PubMed: {len(pubmed_results)} articles")
-        except Exception as e:
-            print(f"   ⚠️  PubMed error: {e}")
+        # Each source is an independent HTTP round-trip, so query them concurrently
+        searches = self._build_source_searches(query, max_results_per_source, days_back)
+        with ThreadPoolExecutor(max_workers=len(searches)) as pool:
+            futures = [(label, pool.submit(search)) for label, search in searches]
 
-        # Search RSS feeds
-        for source_id, source_info in self.sources.items():
-            if source_info["type"] == "rss" and source_id != "pubmed":
+            # Collect in source order so results match a sequential search
+            for label, future in futures:
                 try:
-                    results = self._search_rss_feed(
-                        source_info,
-                        query,
-                        max_results_per_source,
-                        days_back
-                    )
+                    results = future.result()
                     all_results.extend(results)
-                    print(f"   ✅ {source_info['name']}: {len(results)} articles")
+                    print(f"   ✅ {label}: {len(results)} articles")
                 except Exception as e:
-                    print(f"   ⚠️  {source_info['name']} error: {e}")
-
-        # Search with AI News API if available
-        if self.ai_news_api_key:
-            try:
-                ai_news_results = self._search_ai_news_api(query, max_results_per_source)
-                all_results.extend(ai_news_results)
-                print(f"   ✅ AI News API: {len(ai_news_results)} articles")
-            except Exception as e:
-                print(f"   ⚠️  AI News API error: {e}")
-
-        # Search with NewsAPI.org if available
-        if self.newsapi_key:
-            try:
-                newsapi_results = self._search_newsapi(query, max_results_per_source, days_back)
-                all_results.extend(newsapi_results)
-                print(f"   ✅ NewsAPI: {len(newsapi_results)} articles")
-            except Exception as e:
-                print(f"   ⚠️  NewsAPI error: {e}")
+                    print(f"   ⚠️  {label} error: {e}")
 
         # Remove duplicates by URL
         seen_urls = set()
@@ -164,6 +139,32 @@ class CancerNewsAPI:
         print(f"\n📊 Total unique articles found: {len(unique_results)}")
         return unique_results
 
+    def _build_source_searches(
+        self,
+        query: str,
+        max_results_per_source: int,
+        days_back: int
+    ) -> List[Tuple[str, Callable[[], List[Dict[str, Any]]]]]:
+        """Build the (label, search) pairs for every configured source."""
+        searches = [
+            ("PubMed", partial(self._search_pubmed, query, max_results_per_source, days_back))
+        ]
+
+        for source_id, source_info in self.sources.items():
+            if source_info["type"] == "rss" and source_id != "pubmed":
+                searches.append((
+                    source_info["name"],
+                    partial(self._search_rss_feed, source_info, query, max_results_per_source, days_back)
+                ))
+
+        if self.ai_news_api_key:
+            searches.append(("AI News API", partial(self._search_ai_news_api, query, max_results_per_source)))
+
+        if self.newsapi_key:
+            searches.append(("NewsAPI", partial(self._search_newsapi, query, max_results_per_source, days_back)))
+
+        return searches
+
     def _search_pubmed(
         self,
         query: str,
@@ -5,11 +5,17 @@ This module provides direct tool access for agents, bypassing
 traditional routing and enabling more efficient tool usage.
 """
 
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, NamedTuple, Union
 from datetime import datetime
+import hashlib
 import logging
 from pydantic import BaseModel, Field
 
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
 from .tools import NewsSearchTool, DocumentProcessor, FileManager
 from .schemas import ArticleItem
 
@@ -17,6 +23,37 @@ from .schemas import ArticleItem
 logger = logging.getLogger(__name__)
 
 
+def _cache_digest(tool_name: str, kwargs: Dict[str, Any]) -> bytes:
+    """
+    Hash a tool call into a fixed 32-byte cache key.
+
+    Arguments are fed to the hasher one by one, so large content is never
+    copied into an intermediate key string. Every field is prefixed with its
+    length, so no two distinct calls feed the hasher the same bytes. Uses
+    BLAKE3 when installed and BLAKE2b otherwise.
+    """
+    hasher = _blake3() if _blake3 is not None else hashlib.blake2b(digest_size=32)
+
+    def feed(data: bytes) -> None:
+        hasher.update(len(data).to_bytes(8, "little"))
+        hasher.update(data)
+
+    feed(tool_name.encode())
+    for key, value in sorted(kwargs.items()):
+        feed(key.encode())
+        feed(type(value).__name__.encode())
+        feed(value.encode() if isinstance(value, str) else repr(value).encode())
+    return hasher.digest()
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, in the style of functools.lru_cache."""
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
 class ToolResult(BaseModel):
     """Result from a tool execution."""
     tool_name: str
@@ -313,7 +350,9 @@ class DirectToolExecutor:
             registry: Tool registry to use
         """
         self.registry = registry
-        self._cache: Dict[str, Any] = {}
+        self._cache: Dict[Union[str, bytes], Any] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     async def execute_with_retry(
         self,
@@ -385,6 +424,50 @@ class DirectToolExecutor:
 
         return final_results
 
+    async def execute_batch(
+        self,
+        tool_calls: List[Dict[str, Any]]
+    ) -> List[ToolResult]:
+        """
+        Execute tool calls grouped by tool, one worker round-trip per tool.
+
+        Calls to the same tool run back to back in a single worker thread
+        instead of one task each; different tools run concurrently.
+
+        Args:
+            tool_calls: List of tool call specifications
+
+        Returns:
+            List of ToolResults in the same order as tool_calls
+        """
+        import asyncio
+
+        groups: Dict[str, List[int]] = {}
+        for i, call in enumerate(tool_calls):
+            groups.setdefault(call["tool_name"], []).append(i)
+
+        def run_group(tool_name: str, indices: List[int]) -> List[ToolResult]:
+            return [
+                self.registry.execute_tool(
+                    tool_name,
+                    **{k: v for k, v in tool_calls[i].items() if k != "tool_name"}
+                )
+                for i in indices
+            ]
+
+        group_results = await asyncio.gather(*(
+            asyncio.to_thread(run_group, tool_name, indices)
+            for tool_name, indices in groups.items()
+        ))
+
+        results: List[Optional[ToolResult]] = [None] * len(tool_calls)
+        for indices, batch in zip(groups.values(), group_results):
+            for i, result in zip(indices, batch):
+                result.metadata["batch_size"] = len(indices)
+                results[i] = result
+
+        return results
+
     def execute_with_cache(
         self,
         tool_name: str,
@@ -404,21 +487,22 @@ class DirectToolExecutor:
         Returns:
             ToolResult
         """
-        import hashlib
         import time
 
         # Generate cache key if not provided
         if not cache_key:
-            key_data = f"{tool_name}:{str(sorted(kwargs.items()))}"
-            cache_key = hashlib.md5(key_data.encode()).hexdigest()
+            cache_key = _cache_digest(tool_name, kwargs)
 
         # Check cache
         if cache_key in self._cache:
             cached_data, cached_time = self._cache[cache_key]
             if time.time() - cached_time < cache_ttl:
                 logger.info(f"Using cached result for {tool_name}")
+                self._cache_hits += 1
                 return cached_data
 
+        self._cache_misses += 1
+
         # Execute tool
         result = self.registry.execute_tool(tool_name, **kwargs)
 
@@ -426,4 +510,41 @@ class DirectToolExecutor:
         if result.success:
             self._cache[cache_key] = (result, time.time())
 
-        return result
\ No newline at end of file
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Report hit/miss statistics for execute_with_cache."""
+        return CacheInfo(self._cache_hits, self._cache_misses, None, len(self._cache))
+
+    def execute_with_semantic_cache(
+        self,
+        tool_name: str,
+        cache_ttl: int = 300,
+        **kwargs
+    ) -> ToolResult:
+        """
+        Execute a tool with a cache that ignores whitespace and case in text inputs.
+
+        Near-duplicate content (e.g. the same article re-fetched with different
+        formatting) reuses the earlier result instead of re-running the tool.
+
+        Args:
+            tool_name: Name of the tool
+            cache_ttl: Cache time-to-live in seconds
+            **kwargs: Tool parameters
+
+        Returns:
+            ToolResult
+        """
+        normalized = {
+            key: " ".join(value.split()).casefold() if isinstance(value, str) else value
+            for key, value in kwargs.items()
+        }
+        cache_key = _cache_digest(f"semantic:{tool_name}", normalized)
+
+        return self.execute_with_cache(
+            tool_name,
+            cache_key=cache_key,
+            cache_ttl=cache_ttl,
+            **kwargs
+        )
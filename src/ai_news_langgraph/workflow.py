@@ -1,12 +1,17 @@
 """WorkflowExecutor for orchestrating the LangGraph workflow."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Awaitable, Callable, Optional, List, Tuple, Union
 import asyncio
+import inspect
 import logging
+import secrets
+import time
+import traceback
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 
 from langgraph.graph import StateGraph, END
+from langgraph.graph.message import add_messages
 from langgraph.checkpoint.memory import MemorySaver
 
 # Try to import SqliteSaver, but make it optional
@@ -17,6 +22,18 @@ except ImportError:
     SqliteSaver = None
     SQLITE_AVAILABLE = False
 
+# Prefer orjson for serializing streaming updates, fall back to stdlib json
+try:
+    import orjson
+
+    def _dumps(obj: Dict[str, Any]) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _dumps(obj: Dict[str, Any]) -> bytes:
+        return json.dumps(obj, default=str, separators=(",", ":")).encode()
+
 # Use state_base to avoid circular dependency with LangGraph MessagesState
 try:
     from .state import WorkflowState
@@ -36,6 +53,28 @@ except ImportError:
     PHOENIX_ENABLED = False
     logger.info("Phoenix observability not available")
 
+# Topic counts up to this size get an unrolled graph with static edges
+SPECIALIZE_THRESHOLD = 32
+
+# Server-Sent Events framing for streaming updates
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+# Receives each encoded streaming update; may be sync or async
+UpdateSink = Callable[[bytes], Union[None, Awaitable[None]]]
+
+# Millisecond-bucketed ISO timestamp shared by streaming updates
+_ts_cache = (0, "")
+
+
+def _cached_timestamp() -> str:
+    """Return an ISO timestamp, reformatted at most once per millisecond."""
+    global _ts_cache
+    now_ms = time.monotonic_ns() // 1_000_000
+    if now_ms != _ts_cache[0]:
+        _ts_cache = (now_ms, datetime.now().isoformat())
+    return _ts_cache[1]
+
 
 class WorkflowExecutor:
     """
@@ -54,7 +93,11 @@ class WorkflowExecutor:
         self.nodes = WorkflowNodesV2()
         self.checkpoint_type = checkpoint_type
         self.graph = None
+        self.checkpointer = None
         self.executor = ThreadPoolExecutor(max_workers=3)
+
+        # Compiled graphs specialized for a fixed topic count
+        self._specialized_graphs: Dict[int, Any] = {}
         
         # Build the graph immediately (LLM is now lazy-loaded)
         self.build_graph()
@@ -67,31 +110,54 @@ class WorkflowExecutor:
             Compiled StateGraph
         """
         logger.info("Building workflow graph")
+        self.graph = self._compile_graph()
+        logger.info("Graph built successfully")
+        return self.graph
 
+    def _compile_graph(self, topics_count: Optional[int] = None):
+        """
+        Assemble and compile a graph from the node and edge hooks.
+
+        Args:
+            topics_count: Unroll the per-topic loop for this many topics,
+                or keep the conditional loop when None
+
+        Returns:
+            Compiled StateGraph
+        """
         # Create the graph builder
         builder = StateGraph(WorkflowState)
 
         # Add all nodes
-        self._add_nodes(builder)
+        self._add_nodes(builder, topics_count)
 
         # Add all edges
-        self._add_edges(builder)
+        self._add_edges(builder, topics_count)
 
-        # Compile with appropriate checkpointer
-        checkpointer = self._get_checkpointer()
-        self.graph = builder.compile(checkpointer=checkpointer)
+        # Compile with appropriate checkpointer (shared by every compiled graph)
+        if self.checkpointer is None:
+            self.checkpointer = self._get_checkpointer()
+        return builder.compile(checkpointer=self.checkpointer)
 
-        logger.info("Graph built successfully")
-        return self.graph
+    @staticmethod
+    def _topic_steps(topics_count: int) -> List[Tuple[str, str]]:
+        """Fetch/summarize node names for an unrolled topic loop."""
+        # The loop graph always makes at least one fetch/summarize pass
+        return [(f"fetch_news_{i}", f"summarize_topic_{i}") for i in range(max(topics_count, 1))]
 
-    def _add_nodes(self, builder: StateGraph) -> None:
+    def _add_nodes(self, builder: StateGraph, topics_count: Optional[int] = None) -> None:
         """Add all nodes to the graph."""
         # Initialization
         builder.add_node("initialize", self.nodes.initialize_workflow)
 
         # Research phase
-        builder.add_node("fetch_news", self.nodes.fetch_news_for_topic)
-        builder.add_node("summarize_topic", self.nodes.summarize_topic)
+        if topics_count is None:
+            builder.add_node("fetch_news", self.nodes.fetch_news_for_topic)
+            builder.add_node("summarize_topic", self.nodes.summarize_topic)
+        else:
+            for fetch_node, summarize_node in self._topic_steps(topics_count):
+                builder.add_node(fetch_node, self.nodes.fetch_news_for_topic)
+                builder.add_node(summarize_node, self.nodes.summarize_topic)
 
         # Quality control
         builder.add_node("review_quality", self.nodes.review_quality)
@@ -102,23 +168,34 @@ class WorkflowExecutor:
         # Set entry point
         builder.set_entry_point("initialize")
 
-    def _add_edges(self, builder: StateGraph) -> None:
+    def _add_edges(self, builder: StateGraph, topics_count: Optional[int] = None) -> None:
         """Add all edges and conditional routing to the graph."""
-        # Linear flow from initialization
-        builder.add_edge("initialize", "fetch_news")
-
-        # Fetch -> Summarize flow
-        builder.add_edge("fetch_news", "summarize_topic")
-
-        # Conditional routing after summarization
-        builder.add_conditional_edges(
-            "summarize_topic",
-            self._should_continue_topics,
-            {
-                "fetch_more": "fetch_news",
-                "review": "review_quality"
-            }
-        )
+        if topics_count is None:
+            # Linear flow from initialization
+            builder.add_edge("initialize", "fetch_news")
+
+            # Fetch -> Summarize flow
+            builder.add_edge("fetch_news", "summarize_topic")
+
+            # Conditional routing after summarization
+            builder.add_conditional_edges(
+                "summarize_topic",
+                self._should_continue_topics,
+                {
+                    "fetch_more": "fetch_news",
+                    "review": "review_quality"
+                }
+            )
+        else:
+            # Unrolled loop: each topic's fetch/summarize pair chains to the
+            # next, so no routing function runs between topics. The nodes
+            # still read current_topic_index from state.
+            previous = "initialize"
+            for fetch_node, summarize_node in self._topic_steps(topics_count):
+                builder.add_edge(previous, fetch_node)
+                builder.add_edge(fetch_node, summarize_node)
+                previous = summarize_node
+            builder.add_edge(previous, "review_quality")
 
         # Review -> Generate flow
         builder.add_edge("review_quality", "generate_newsletter")
@@ -142,13 +219,34 @@ class WorkflowExecutor:
         topics = topics_config.get("topics", [])
         current_index = state.get("current_topic_index", 0)
 
-        logger.info(f"Decision point: {current_index}/{len(topics)} topics processed")
+        logger.info("Decision point: %d/%d topics processed", current_index, len(topics))
 
         if current_index < len(topics):
             return "fetch_more"
         else:
             return "review"
 
+    def _get_graph_for_topics(self, topics_count: int):
+        """
+        Pick the compiled graph for a run.
+
+        Args:
+            topics_count: Number of topics the run will process
+
+        Returns:
+            Graph with the topic loop unrolled for small topic counts,
+            otherwise the default graph
+        """
+        if topics_count > SPECIALIZE_THRESHOLD:
+            return self.graph
+
+        graph = self._specialized_graphs.get(topics_count)
+        if graph is None:
+            logger.info("Building specialized workflow graph for %d topics", topics_count)
+            graph = self._compile_graph(topics_count)
+            self._specialized_graphs[topics_count] = graph
+        return graph
+
     def _get_checkpointer(self):
         """Get the appropriate checkpointer based on configuration."""
         if self.checkpoint_type == "sqlite":
@@ -166,7 +264,8 @@ class WorkflowExecutor:
         topics_path: Optional[str] = None,
         thread_id: Optional[str] = None,
         stream_output: bool = False,
-        selected_topics: Optional[List[str]] = None
+        selected_topics: Optional[List[str]] = None,
+        on_update: Optional[UpdateSink] = None
     ) -> Dict[str, Any]:
         """
         Execute the workflow asynchronously.
@@ -177,6 +276,8 @@ class WorkflowExecutor:
             thread_id: Thread ID for conversation management
             stream_output: Whether to stream outputs in real-time
             selected_topics: List of topic names to include in newsletter (None = all topics)
+            on_update: Called (or awaited) with an SSE ``data:`` frame after each
+                node when streaming, e.g. to forward to an SSE/WebSocket client
 
         Returns:
             Execution results dictionary
@@ -185,12 +286,17 @@ class WorkflowExecutor:
         if not self.graph:
             self.build_graph()
 
-        # Create thread_id first
-        thread_id_str = thread_id or f"thread_{datetime.now().timestamp()}"
+        # Create thread_id first (nanosecond clock + random suffix so concurrent runs never collide)
+        thread_id_str = thread_id or f"thread_{time.time_ns():x}_{secrets.token_hex(4)}"
+
+        # Load the topics once; initialize_workflow reuses this config and
+        # the graph topology is picked from the same topic list
+        topics_config = self.nodes.load_topics_config(topics_path)
 
         # Create initial state
         initial_state = WorkflowState(
             main_topic=main_topic,
+            topics_config=topics_config,
             topics_path=topics_path,
             thread_id=thread_id_str,
             selected_topic_names=selected_topics
@@ -204,28 +310,38 @@ class WorkflowExecutor:
 
         try:
             # Debug: Check what type initial_state is
-            logger.info(f"initial_state type: {type(initial_state)}, has thread_id: {hasattr(initial_state, 'thread_id')}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "initial_state type=%s has_thread_id=%s",
+                    type(initial_state).__name__,
+                    hasattr(initial_state, "thread_id")
+                )
             
             # Ensure initial_state is a WorkflowState object
             if isinstance(initial_state, dict):
                 logger.warning("initial_state is a dict, converting to WorkflowState")
                 initial_state = WorkflowState(**initial_state)
             
+            graph = self._get_graph_for_topics(len(topics_config.get("topics", [])))
+
             if stream_output:
                 # Stream execution for real-time updates
                 final_state = await self._execute_with_streaming(
                     initial_state,
-                    config
+                    config,
+                    graph,
+                    on_update
                 )
             else:
                 # Standard execution
                 final_state = await self._execute_standard(
                     initial_state,
-                    config
+                    config,
+                    graph
                 )
 
             # Work with final_state as dict (WorkflowState is a TypedDict, not a Pydantic model)
-            logger.info("Processing final state (dict)")
+            logger.debug("Processing final state (dict)")
             
             # Calculate metrics from dict
             metrics = {
@@ -245,7 +361,6 @@ class WorkflowExecutor:
             }
 
         except Exception as e:
-            import traceback
             logger.error(f"Workflow execution failed: {e}")
             logger.error(f"Traceback: {traceback.format_exc()}")
             return {
@@ -258,25 +373,26 @@ class WorkflowExecutor:
     async def _execute_standard(
         self,
         initial_state: WorkflowState,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        graph=None
     ) -> WorkflowState:
         """Execute workflow in standard mode."""
+        graph = graph or self.graph
+
         # Handle both dict and WorkflowState
         if isinstance(initial_state, dict):
             thread_id_val = initial_state.get("thread_id", "unknown")
-            state_obj = WorkflowState(**initial_state)
             initial_state_dict = initial_state  # Already a dict
         else:
             thread_id_val = initial_state.thread_id
-            state_obj = initial_state
             initial_state_dict = initial_state.model_dump()
             
-        logger.info(f"Starting standard execution for thread {thread_id_val}")
+        logger.info("Starting standard execution for thread %s", thread_id_val)
 
         # initial_state_dict is now properly set for Lang Graph
 
         # Run the graph asynchronously (nodes are async)
-        final_state_dict = await self.graph.ainvoke(
+        final_state_dict = await graph.ainvoke(
             initial_state_dict,  # Pass dict, not Pydantic object
             config
         )
@@ -285,7 +401,7 @@ class WorkflowExecutor:
         if isinstance(final_state_dict, dict):
             try:
                 final_state = WorkflowState(**final_state_dict)
-                logger.info(f"Converted final_state_dict to WorkflowState: type={type(final_state)}")
+                logger.debug("Converted final_state_dict to WorkflowState: type=%s", type(final_state).__name__)
             except Exception as e:
                 logger.error(f"Failed to convert final_state_dict to WorkflowState: {e}")
                 # Return dict as-is if conversion fails
@@ -294,65 +410,92 @@ class WorkflowExecutor:
         else:
             final_state = final_state_dict
 
-        logger.info(f"Returning final_state: type={type(final_state)}")
+        logger.debug("Returning final_state: type=%s", type(final_state).__name__)
         return final_state
 
     async def _execute_with_streaming(
         self,
         initial_state: WorkflowState,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        graph=None,
+        on_update: Optional[UpdateSink] = None
     ) -> WorkflowState:
-        """Execute workflow with streaming updates."""
+        """Execute workflow with streaming updates, passing each to on_update."""
+        graph = graph or self.graph
+
         # Handle both dict and WorkflowState
         if isinstance(initial_state, dict):
             thread_id_val = initial_state.get("thread_id", "unknown")
-            state_obj = WorkflowState(**initial_state)
             initial_state_dict = initial_state  # Already a dict
         else:
             thread_id_val = initial_state.thread_id
-            state_obj = initial_state
             initial_state_dict = initial_state.model_dump()
             
-        logger.info(f"Starting streaming execution for thread {thread_id_val}")
+        logger.info("Starting streaming execution for thread %s", thread_id_val)
 
-        # Use state_obj for initial state
-        final_state = state_obj
+        # Accumulate per-node deltas instead of receiving full snapshots
+        final_state_dict = dict(initial_state_dict)
 
         # Stream through the graph
-        async for chunk in self.graph.astream(initial_state_dict, config):
+        async for chunk in graph.astream(initial_state_dict, config, stream_mode="updates"):
             # Process each chunk and emit updates
-            for node_name, node_state in chunk.items():
-                logger.info(f"Processing node: {node_name}")
+            for node_name, node_update in chunk.items():
+                logger.info("Processing node: %s", node_name)
 
-                # Emit real-time update (can be sent via SSE, WebSocket, etc.)
-                await self._emit_update(node_name, node_state)
+                if node_update:
+                    self._merge_update(final_state_dict, node_update)
 
-                # Convert dict to WorkflowState
-                if isinstance(node_state, dict):
-                    final_state = WorkflowState(**node_state)
-                else:
-                    final_state = node_state
+                # Frames are only encoded when someone consumes them
+                if on_update is not None:
+                    delivered = on_update(self._encode_update(node_name, final_state_dict))
+                    if inspect.isawaitable(delivered):
+                        await delivered
 
-        return final_state
+        # Convert dict back to WorkflowState once, after streaming completes
+        try:
+            return WorkflowState(**final_state_dict)
+        except Exception as e:
+            logger.error(f"Failed to convert final_state_dict to WorkflowState: {e}")
+            return final_state_dict
 
-    async def _emit_update(self, node_name: str, state: WorkflowState) -> None:
+    @staticmethod
+    def _merge_update(state_dict: Dict[str, Any], node_update: Dict[str, Any]) -> None:
         """
-        Emit real-time update for streaming mode.
+        Shallow-merge a node update into the accumulated state.
+
+        Mirrors the graph's channel semantics: ``messages`` goes through the
+        ``add_messages`` reducer, every other key is overwritten.
+
+        Args:
+            state_dict: Accumulated state to update in place
+            node_update: Partial state returned by a node
+        """
+        for key, value in node_update.items():
+            if key == "messages":
+                state_dict[key] = add_messages(state_dict.get(key, []), value)
+            else:
+                state_dict[key] = value
+
+    def _encode_update(self, node_name: str, state: Dict[str, Any]) -> bytes:
+        """
+        Encode a real-time update for streaming mode.
 
         Args:
             node_name: Name of the current node
-            state: Current state
+            state: Current accumulated state (dict)
+
+        Returns:
+            The update encoded once as an SSE ``data:`` frame
         """
-        update = {
+        payload = _dumps({
             "node": node_name,
-            "stage": state.current_stage,
-            "topics_processed": state.total_topics_processed,
-            "articles_fetched": state.total_articles_fetched,
-            "timestamp": datetime.now().isoformat()
-        }
-
-        # In a real implementation, this would send via SSE/WebSocket
-        logger.info(f"Update: {update}")
+            "stage": state.get("current_stage"),
+            "topics_processed": state.get("total_topics_processed", 0),
+            "articles_fetched": state.get("total_articles_fetched", 0),
+            "timestamp": _cached_timestamp()
+        })
+        logger.debug("Update from %s (stage=%s)", node_name, state.get("current_stage"))
+        return _SSE_PREFIX + payload + _SSE_SUFFIX
 
     def get_state(self, thread_id: str) -> Optional[WorkflowState]:
         """
@@ -392,9 +535,9 @@ class ParallelWorkflowExecutor(WorkflowExecutor):
     Extended executor with parallel task execution capabilities.
     """
 
-    def _add_nodes(self, builder: StateGraph) -> None:
+    def _add_nodes(self, builder: StateGraph, topics_count: Optional[int] = None) -> None:
         """Add nodes including parallel execution support."""
-        super()._add_nodes(builder)
+        super()._add_nodes(builder, topics_count)
 
         # Add parallel fetch node for multiple topics
         builder.add_node("parallel_fetch", self._parallel_fetch_topics)
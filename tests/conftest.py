@@ -5,10 +5,77 @@ This file is automatically loaded by pytest.
 
 import sys
 from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
 
 # Add the project root to Python path so we can import src modules
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 print(f"Added to Python path: {project_root}")
-print(f"Python path: {sys.path[:3]}")  # Show first 3 paths for debugging
\ No newline at end of file
+print(f"Python path: {sys.path[:3]}")  # Show first 3 paths for debugging
+
+
+@pytest.fixture(scope="session")
+def prompt_registry():
+    """PromptRegistry shared by every read-only prompt test in a run."""
+    from src.ai_news_langgraph.prompts import PromptRegistry
+    return PromptRegistry()
+
+
+@pytest.fixture
+def mutable_prompt_registry():
+    """Fresh PromptRegistry for tests that register or modify prompts."""
+    from src.ai_news_langgraph.prompts import PromptRegistry
+    return PromptRegistry()
+
+
+@pytest.fixture
+def mock_llm():
+    """Create a fake chat model; assign ``responses`` to script its replies."""
+    from langchain_core.language_models import FakeListChatModel
+    return FakeListChatModel(responses=["0.85"])
+
+
+@pytest.fixture(scope="module")
+def mock_news_tool():
+    """Create a mock news search tool, shared within a test module.
+
+    Tests that need a different search behaviour override it with monkeypatch.
+    """
+    mock = Mock()
+    mock.search = Mock(return_value=[
+        {
+            "title": "AI Breakthrough in Cancer",
+            "url": "https://example.com/1",
+            "content": "Amazing breakthrough...",
+            "source": "Medical News",
+            "summary": "AI achieves 95% accuracy"
+        },
+        {
+            "title": "New ML Model for Diagnosis",
+            "url": "https://example.com/2",
+            "content": "Innovative model...",
+            "source": "Research Journal",
+            "summary": "ML improves diagnosis speed"
+        }
+    ])
+    return mock
+
+
+@pytest.fixture
+def workflow_nodes(mock_llm, mock_news_tool):
+    """Create WorkflowNodesV2 with mocked dependencies.
+
+    ChatOpenAI itself is stubbed by the test module; the LLM is created lazily
+    and replaced with mock_llm here.
+    """
+    from src.ai_news_langgraph.nodes_v2 import WorkflowNodesV2
+
+    nodes = WorkflowNodesV2()
+    nodes.llm = mock_llm
+    # The tool is shared, so start each test with a clean call history
+    mock_news_tool.search.reset_mock()
+    nodes.news_tool = mock_news_tool
+    return nodes
@@ -3,22 +3,78 @@ Test script for the refactored LangGraph implementation following metamorphosis
 """
 
 import asyncio
+import functools
 import json
+import os
+import time
 from datetime import datetime
 from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from src.ai_news_langgraph.graph_v2 import AINewsWorkflow
-from src.ai_news_langgraph.tools_direct import DirectToolRegistry, DirectToolExecutor
+from src.ai_news_langgraph.tools_direct import DirectToolRegistry, DirectToolExecutor, _cache_digest
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_registry() -> DirectToolRegistry:
+    """Tool registry shared by every test in a run."""
+    return DirectToolRegistry()
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_workflow() -> AINewsWorkflow:
+    """Default (sequential, in-memory) workflow shared by every test in a run."""
+    return AINewsWorkflow(
+        use_parallel=False,
+        checkpoint_type="memory",
+        enable_streaming=False
+    )
+
+
+@pytest.fixture(scope="session")
+def registry():
+    """Session-wide DirectToolRegistry."""
+    return _shared_registry()
+
+
+@pytest.fixture(scope="session")
+def workflow():
+    """Session-wide AINewsWorkflow."""
+    return _shared_workflow()
 
 
-def test_direct_tools():
+def _write_config(path, config):
+    """Write a test topics config, using orjson when it is installed."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(config, f, indent=2)
+
+
+def _format_timings(timings):
+    """Format (name, nanoseconds) pairs, slowest first."""
+    return "\n".join(
+        f"   {name}: {ns / 1e6:.2f}ms"
+        for name, ns in sorted(timings, key=lambda item: item[1], reverse=True)
+    )
+
+
+@pytest.mark.network
+def test_direct_tools(registry):
     """Test direct tool access functionality."""
     print("\n" + "="*60)
     print("Testing Direct Tool Access")
     print("="*60)
 
-    # Initialize registry
-    registry = DirectToolRegistry()
+    timings = []
 
     # List available tools
     print("\nAvailable Tools:")
@@ -28,13 +84,14 @@ def test_direct_tools():
 
     # Test search tool
     print("\n1. Testing news search tool...")
+    start = time.perf_counter_ns()
     result = registry.execute_tool(
         "search_news",
         query="AI cancer diagnosis",
         max_results=3
     )
+    timings.append(("search_news", time.perf_counter_ns() - start))
     print(f"   Success: {result.success}")
-    print(f"   Execution time: {result.execution_time:.2f}s")
 
     # Test achievement extraction
     print("\n2. Testing achievement extraction...")
@@ -43,7 +100,9 @@ def test_direct_tools():
     The team completed the integration of the new AI model.
     Research succeeded in identifying key biomarkers.
     """
+    start = time.perf_counter_ns()
     result = registry.execute_tool("extract_achievements", content=sample_text)
+    timings.append(("extract_achievements", time.perf_counter_ns() - start))
     print(f"   Success: {result.success}")
     if result.success:
         print(f"   Found {result.output['total_count']} achievements")
@@ -59,26 +118,26 @@ def test_direct_tools():
     - Reduced false positives
     - Faster processing time
     """
+    start = time.perf_counter_ns()
     result = registry.execute_tool("evaluate_review_text", text=review_text)
+    timings.append(("evaluate_review_text", time.perf_counter_ns() - start))
     print(f"   Success: {result.success}")
     if result.success:
         print(f"   Quality score: {result.output['quality_score']:.2f}")
         print(f"   Meets criteria: {result.output['meets_criteria']}")
 
+    print("\nExecution times:")
+    print(_format_timings(timings))
+
 
-async def test_workflow_async():
+@pytest.mark.slow
+@pytest.mark.network
+async def test_workflow_async(workflow):
     """Test the async workflow execution."""
     print("\n" + "="*60)
     print("Testing Async Workflow Execution")
     print("="*60)
 
-    # Initialize workflow
-    workflow = AINewsWorkflow(
-        use_parallel=False,
-        checkpoint_type="memory",
-        enable_streaming=False
-    )
-
     # Create test topics configuration
     test_config = {
         "main_topic": "AI in Cancer Research - Test",
@@ -97,17 +156,19 @@ async def test_workflow_async():
     }
 
     # Save test config
-    config_path = "test_config.json"
-    with open(config_path, "w") as f:
-        json.dump(test_config, f, indent=2)
+    config_path = f"test_config_{uuid4().hex}.json"
+    _write_config(config_path, test_config)
 
     print(f"\nRunning workflow with {len(test_config['topics'])} topics...")
 
-    # Run workflow
-    result = await workflow.run_async(
-        main_topic=test_config["main_topic"],
-        topics_path=config_path
-    )
+    # Run workflow; the config is removed even if the task gets cancelled
+    try:
+        result = await workflow.run_async(
+            main_topic=test_config["main_topic"],
+            topics_path=config_path
+        )
+    finally:
+        Path(config_path).unlink(missing_ok=True)
 
     # Display results
     print("\nWorkflow Results:")
@@ -132,12 +193,11 @@ async def test_workflow_async():
         for error in result['errors'][:3]:
             print(f"  - {error}")
 
-    # Clean up
-    Path(config_path).unlink(missing_ok=True)
-
     return result
 
 
+@pytest.mark.slow
+@pytest.mark.network
 async def test_parallel_workflow():
     """Test parallel topic processing."""
     print("\n" + "="*60)
@@ -166,36 +226,41 @@ async def test_parallel_workflow():
         ]
     }
 
-    config_path = "test_parallel_config.json"
-    with open(config_path, "w") as f:
-        json.dump(test_config, f, indent=2)
+    config_path = f"test_parallel_config_{uuid4().hex}.json"
+    _write_config(config_path, test_config)
 
     # Run with timing
-    import time
     start_time = time.time()
 
-    result = await workflow.run_async(
-        main_topic=test_config["main_topic"],
-        topics_path=config_path
-    )
+    try:
+        result = await workflow.run_async(
+            main_topic=test_config["main_topic"],
+            topics_path=config_path
+        )
+    finally:
+        Path(config_path).unlink(missing_ok=True)
 
     elapsed_time = time.time() - start_time
 
     print(f"\nParallel execution completed in {elapsed_time:.2f}s")
     print(f"Status: {result['status']}")
 
-    # Clean up
-    Path(config_path).unlink(missing_ok=True)
+
+def test_cache_digest_separates_fields():
+    """Different kwargs never share a cache key, even with embedded NULs."""
+    assert _cache_digest("search_news", {"a": "x\0b\0str\0y"}) != _cache_digest(
+        "search_news", {"a": "x", "b": "y"}
+    )
+    assert _cache_digest("search_news", {"query": "1"}) != _cache_digest("search_news", {"query": 1})
+    assert _cache_digest("search_news", {"query": "ai"}) == _cache_digest("search_news", {"query": "ai"})
 
 
-def test_workflow_status():
+def test_workflow_status(workflow):
     """Test workflow status and thread management."""
     print("\n" + "="*60)
     print("Testing Workflow Status & Thread Management")
     print("="*60)
 
-    workflow = AINewsWorkflow()
-
     # Test with a specific thread ID
     test_thread_id = f"test_thread_{datetime.now().timestamp()}"
 
@@ -209,56 +274,108 @@ def test_workflow_status():
     print(f"  Found {len(workflows)} workflows")
 
 
-async def test_tool_executor():
+@pytest.mark.network
+async def test_tool_executor(registry):
     """Test the DirectToolExecutor with advanced features."""
     print("\n" + "="*60)
     print("Testing DirectToolExecutor")
     print("="*60)
 
-    registry = DirectToolRegistry()
     executor = DirectToolExecutor(registry)
+    timings = []
 
-    # Test retry logic
-    print("\n1. Testing retry logic...")
-    result = await executor.execute_with_retry(
-        "search_news",
-        max_retries=2,
-        query="test query",
-        max_results=5
-    )
-    print(f"   Success: {result.success}")
-
-    # Test parallel execution
-    print("\n2. Testing parallel tool execution...")
+    # Retry and parallel execution are independent, so run them concurrently
+    print("\n1. Testing retry logic and 2. parallel tool execution...")
     tool_calls = [
         {"tool_name": "extract_achievements", "content": "Test achieved success."},
         {"tool_name": "evaluate_review_text", "text": "Test review text."}
     ]
 
-    results = await executor.execute_parallel(tool_calls)
+    start = time.perf_counter_ns()
+    retry_result, results = await asyncio.gather(
+        executor.execute_with_retry(
+            "search_news",
+            max_retries=2,
+            query="test query",
+            max_results=5
+        ),
+        executor.execute_parallel(tool_calls)
+    )
+    timings.append(("retry + parallel", time.perf_counter_ns() - start))
+    print(f"   Retry success: {retry_result.success}")
+
     print(f"   Executed {len(results)} tools in parallel")
     for i, result in enumerate(results):
         print(f"   Tool {i+1}: Success={result.success}")
 
+    # Calls to the same tool share one worker round-trip
+    print("\n   Testing batched tool execution...")
+    batch_calls = [
+        {"tool_name": "extract_achievements", "content": "Phase II trial completed."},
+        {"tool_name": "evaluate_review_text", "text": "Test review text."},
+        {"tool_name": "extract_achievements", "content": "Model achieved 94% accuracy."},
+    ]
+    start = time.perf_counter_ns()
+    batch_results = await executor.execute_batch(batch_calls)
+    timings.append(("batch", time.perf_counter_ns() - start))
+
+    assert [r.tool_name for r in batch_results] == [c["tool_name"] for c in batch_calls]
+    assert all(r.success for r in batch_results)
+    assert [r.metadata["batch_size"] for r in batch_results] == [2, 1, 2]
+    print(f"   Batched {len(batch_calls)} calls into {len({c['tool_name'] for c in batch_calls})} round-trips")
+
     # Test caching
     print("\n3. Testing tool caching...")
 
     # First call (not cached)
+    start = time.perf_counter_ns()
     result1 = executor.execute_with_cache(
         "extract_achievements",
         content="Cached test content",
         cache_ttl=60
     )
+    timings.append(("cache miss", time.perf_counter_ns() - start))
 
     # Second call (should be cached)
+    start = time.perf_counter_ns()
     result2 = executor.execute_with_cache(
         "extract_achievements",
         content="Cached test content",
         cache_ttl=60
     )
+    timings.append(("cache hit", time.perf_counter_ns() - start))
 
-    print(f"   First call time: {result1.execution_time:.4f}s")
-    print(f"   Second call time: {result2.execution_time:.4f}s (cached)")
+    # A cache hit hands back the stored result instead of re-running the tool
+    assert result1.success
+    assert result2 is result1
+
+    print("   Second call served from cache")
+
+    # Near-duplicate content differing only in whitespace reuses the result
+    print("\n4. Testing semantic caching...")
+    variants = [
+        "The team achieved a breakthrough.\nTrial completed.",
+        "The team  achieved a breakthrough.\n\nTrial completed.  ",
+        "  The team achieved a\tbreakthrough.\nTrial completed.",
+    ]
+    semantic_results = [
+        executor.execute_with_semantic_cache("extract_achievements", content=content, cache_ttl=60)
+        for content in variants
+    ]
+    cache_hits = sum(1 for result in semantic_results[1:] if result is semantic_results[0])
+    assert cache_hits >= 2
+    print(f"   Cache hits: {cache_hits}/{len(variants) - 1}")
+
+    # Large content is keyed by a fixed-size digest, not the content itself
+    large_content = "Trial completed. " * 3000
+    large_result = executor.execute_with_cache("extract_achievements", content=large_content, cache_ttl=60)
+    assert executor.execute_with_cache("extract_achievements", content=large_content, cache_ttl=60) is large_result
+    assert all(len(key) == 32 for key in executor._cache)
+    print(f"   {len(large_content) // 1024}KB content cached under a 32-byte key")
+    print(f"   {executor.cache_info()}")
+
+    print("\nExecution times:")
+    print(_format_timings(timings))
 
 
 def main():
@@ -267,27 +384,64 @@ def main():
     print("METAMORPHOSIS PATTERN IMPLEMENTATION TEST SUITE")
     print("="*60)
 
-    # Test direct tools
-    test_direct_tools()
+    # Tools and workflow are built once and shared across tests
+    registry = _shared_registry()
+    workflow = _shared_workflow()
 
     # Test workflow status
-    test_workflow_status()
+    test_workflow_status(workflow)
+
+    # Tool searches and the async suite hit live sources; FAST_TESTS leaves
+    # them to the nightly job
+    if os.environ.get("FAST_TESTS"):
+        print("\nFAST_TESTS set, skipping network-bound tests")
+        return
+
+    # Test direct tools
+    test_direct_tools(registry)
 
     # Run async tests
     print("\nRunning async tests...")
-    asyncio.run(test_async_suite())
+    asyncio.run(test_async_suite(registry, workflow))
 
 
-async def test_async_suite():
+@pytest.mark.slow
+@pytest.mark.network
+async def test_async_suite(registry, workflow):
     """Run all async tests."""
-    # Test tool executor
-    await test_tool_executor()
-
-    # Test basic workflow
-    await test_workflow_async()
-
-    # Test parallel workflow
-    await test_parallel_workflow()
+    # The suites are independent and I/O-bound, so run them concurrently.
+    # A TaskGroup cancels the remaining suites as soon as one fails.
+    suites = {
+        "Tool executor": test_tool_executor(registry),
+        "Basic workflow": test_workflow_async(workflow),
+        "Parallel workflow": test_parallel_workflow(),
+    }
+    failure = None
+    if hasattr(asyncio, "TaskGroup"):
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = {name: tg.create_task(coro) for name, coro in suites.items()}
+        except Exception as group:  # ExceptionGroup
+            failure = group.exceptions[0]
+    else:
+        # Python 3.10 has no TaskGroup; gather without fail-fast cancellation
+        tasks = {name: asyncio.ensure_future(coro) for name, coro in suites.items()}
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        failure = next((t.exception() for t in tasks.values() if t.exception()), None)
+
+    print("\nAsync suite results:")
+    for name, task in tasks.items():
+        if task.cancelled():
+            status = "CANCELLED"
+        elif task.exception() is not None:
+            status = f"FAILED ({task.exception()!r})"
+        else:
+            status = "OK"
+        print(f"  {name}: {status}")
+
+    # Surface the first failure so the suite still fails as before
+    if failure is not None:
+        raise failure
 
     print("\n" + "="*60)
     print("ALL TESTS COMPLETED")
@@ -7,26 +7,125 @@ Test script for new features:
 4. Alternative news APIs
 """
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
+import os
+import pickle
+import re
 import sys
+import threading
+import time
+import traceback
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import pytest
 import yaml
 from typing import Dict, Any
 
+# Optional feature modules: a missing dependency skips the tests that need it
+CancerNewsAPI = None
+NewsSearchTool = None
+enhanced_prompt_registry = None
+get_enhanced_prompt = None
 
-def test_cancer_news_sources():
+with contextlib.suppress(ImportError):
+    from src.ai_news_langgraph.tools_cancer_news import CancerNewsAPI
+with contextlib.suppress(ImportError):
+    from src.ai_news_langgraph.tools import NewsSearchTool
+with contextlib.suppress(ImportError):
+    from src.ai_news_langgraph.prompts_enhanced import (
+        enhanced_prompt_registry,
+        get_enhanced_prompt
+    )
+
+requires_cancer_news = pytest.mark.skipif(CancerNewsAPI is None, reason="tools_cancer_news dependencies not installed")
+requires_news_tool = pytest.mark.skipif(NewsSearchTool is None, reason="tools dependencies not installed")
+requires_enhanced_prompts = pytest.mark.skipif(get_enhanced_prompt is None, reason="prompts_enhanced dependencies not installed")
+
+# Use the libyaml-backed loader when it is available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# CO-STAR section headers and few-shot markers, matched in a single pass
+_COSTAR_COMPONENTS = ("# CONTEXT", "# OBJECTIVE", "# STYLE", "# TONE", "# AUDIENCE", "# RESPONSE FORMAT")
+_EXAMPLE_MARKERS = ("Example", "EXAMPLE")
+_PROMPT_MARKER_RE = re.compile("|".join(map(re.escape, _COSTAR_COMPONENTS + _EXAMPLE_MARKERS)))
+
+
+# Parsed YAML is pickled under the pytest cache, keyed on (path, mtime, size)
+_YAML_CACHE_DIR = Path(__file__).resolve().parent.parent / ".pytest_cache" / "yaml"
+
+
+def parse_yaml(path: Path) -> Dict[str, Any]:
+    """Parse a YAML file without any caching."""
+    return yaml.load(path.read_bytes(), Loader=_YamlLoader)
+
+
+def load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """Load a YAML file through a pickle keyed on its path, mtime and size."""
+    path = path.resolve()
+    st = path.stat()
+    key = f"{path}\0{st.st_mtime_ns}\0{st.st_size}".encode()
+    cache = _YAML_CACHE_DIR / f"{hashlib.sha256(key).hexdigest()}.pkl"
+    try:
+        return pickle.loads(cache.read_bytes())
+    except Exception:
+        pass  # Missing, truncated or stale pickle: treat as a cache miss
+
+    data = parse_yaml(path)
+    try:
+        _YAML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache.write_bytes(pickle.dumps(data, protocol=5))
+    except OSError:
+        pass  # Read-only checkout: fall back to parsing every run
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml(path: str) -> Dict[str, Any]:
+    """Parse a YAML file once per test run."""
+    return load_yaml_cached(Path(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_cancer_api():
+    """CancerNewsAPI shared by every test in a run."""
+    return CancerNewsAPI()
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_news_tool():
+    """NewsSearchTool shared by every test in a run."""
+    return NewsSearchTool()
+
+
+@pytest.fixture(scope="session")
+def cancer_api():
+    """Session-wide CancerNewsAPI."""
+    return _shared_cancer_api()
+
+
+@pytest.fixture(scope="session")
+def news_tool():
+    """Session-wide NewsSearchTool."""
+    return _shared_news_tool()
+
+
+@pytest.mark.network
+@requires_cancer_news
+def test_cancer_news_sources(cancer_api):
     """Test cancer-specific news sources integration."""
     print("\n" + "="*80)
     print("TEST 1: Cancer-Specific News Sources")
     print("="*80)
 
     try:
-        from src.ai_news_langgraph.tools_cancer_news import CancerNewsAPI
-
-        api = CancerNewsAPI()
+        api = cancer_api
         print(f"✅ CancerNewsAPI initialized with {len(api.sources)} sources")
 
         # List sources
@@ -37,12 +136,14 @@ def test_cancer_news_sources():
         # Test search (limited results for testing)
         print("\n🔍 Testing search functionality...")
         try:
+            start = time.perf_counter()
             results = api.search_all_sources(
                 query="AI artificial intelligence cancer",
                 max_results_per_source=2,
                 days_back=30
             )
-            print(f"✅ Search completed: {len(results)} articles found")
+            elapsed = time.perf_counter() - start
+            print(f"✅ Search completed: {len(results)} articles found in {elapsed:.2f}s")
 
             if results:
                 print("\nSample article:")
@@ -59,7 +160,6 @@ def test_cancer_news_sources():
 
     except Exception as e:
         print(f"❌ FAILED: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -88,8 +188,7 @@ def test_agent_configs():
                 all_passed = False
                 continue
 
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = _load_yaml(str(config_path))
 
             # Validate required fields
             required_fields = ['agent_id', 'role', 'goal', 'backstory', 'model', 'temperature']
@@ -129,6 +228,7 @@ def test_agent_configs():
     return all_passed
 
 
+@requires_enhanced_prompts
 def test_enhanced_prompts():
     """Test enhanced CO-STAR prompts with few-shot examples."""
     print("\n" + "="*80)
@@ -136,11 +236,6 @@ def test_enhanced_prompts():
     print("="*80)
 
     try:
-        from src.ai_news_langgraph.prompts_enhanced import (
-            enhanced_prompt_registry,
-            get_enhanced_prompt
-        )
-
         # Check prompts loaded
         all_prompts = enhanced_prompt_registry.list_prompts()
         print(f"✅ Loaded {len(all_prompts)} prompts")
@@ -171,15 +266,15 @@ def test_enhanced_prompts():
         print(f"✅ Full prompt rendered ({len(test_prompt)} chars)")
 
         # Check for key components
-        components = ["# CONTEXT", "# OBJECTIVE", "# STYLE", "# TONE", "# AUDIENCE", "# RESPONSE FORMAT"]
-        for component in components:
-            if component in test_prompt:
+        found = set(_PROMPT_MARKER_RE.findall(test_prompt))
+        for component in _COSTAR_COMPONENTS:
+            if component in found:
                 print(f"   ✓ Contains {component}")
             else:
                 print(f"   ⚠️  Missing {component}")
 
         # Check for few-shot examples
-        if "Example" in test_prompt or "EXAMPLE" in test_prompt:
+        if not found.isdisjoint(_EXAMPLE_MARKERS):
             print(f"   ✓ Contains few-shot examples")
         else:
             print(f"   ⚠️  Missing few-shot examples")
@@ -204,21 +299,43 @@ def test_enhanced_prompts():
 
     except Exception as e:
         print(f"❌ FAILED: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
-def test_tools_integration():
+@requires_enhanced_prompts
+def test_enhanced_prompt_render_cache():
+    """Rendering the same prompt twice is served from the registry cache."""
+    render_kwargs = dict(
+        agent_name="research_agent",
+        prompt_name="analyze_relevance",
+        topic_name="Test Topic",
+        topic_description="Test description",
+        title="Test title",
+        content="Test content",
+        source="Test source",
+        published_date="2024-01-15",
+        compact=True
+    )
+
+    compact_prompt = get_enhanced_prompt(**render_kwargs)
+    start = time.perf_counter()
+    cached_prompt = get_enhanced_prompt(**render_kwargs)
+    elapsed = time.perf_counter() - start
+
+    assert cached_prompt is compact_prompt
+    print(f"✅ Cached re-render in {elapsed * 1e6:.1f}µs")
+
+
+@requires_news_tool
+def test_tools_integration(news_tool):
     """Test integration of cancer sources into main tools."""
     print("\n" + "="*80)
     print("TEST 4: Tools Integration")
     print("="*80)
 
     try:
-        from src.ai_news_langgraph.tools import NewsSearchTool
-
-        tool = NewsSearchTool()
+        tool = news_tool
         print("✅ NewsSearchTool initialized")
 
         # Check cancer news integration
@@ -243,11 +360,19 @@ def test_tools_integration():
 
     except Exception as e:
         print(f"❌ FAILED: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
+async def _load_yaml_files(paths):
+    """Read and parse YAML files concurrently, returning exceptions in place of failures."""
+    # Always parse here: a cached pickle would hide a syntax error
+    return await asyncio.gather(
+        *(asyncio.to_thread(parse_yaml, path) for path in paths),
+        return_exceptions=True
+    )
+
+
 def test_yaml_validity():
     """Test YAML files for syntax errors."""
     print("\n" + "="*80)
@@ -264,38 +389,37 @@ def test_yaml_validity():
 
     all_valid = True
 
-    for yaml_file in yaml_files:
-        path = Path(yaml_file)
-        try:
-            if not path.exists():
-                print(f"⚠️  {path.name}: File not found")
-                continue
-
-            with open(path, 'r') as f:
-                data = yaml.safe_load(f)
+    paths = [Path(yaml_file) for yaml_file in yaml_files]
+    existing = [path for path in paths if path.exists()]
+    parsed = dict(zip(existing, asyncio.run(_load_yaml_files(existing))))
 
-            print(f"✅ {path.name}: Valid YAML ({len(str(data))} chars)")
+    for path in paths:
+        if path not in parsed:
+            print(f"⚠️  {path.name}: File not found")
+            continue
 
-        except Exception as e:
-            print(f"❌ {path.name}: {e}")
+        data = parsed[path]
+        if isinstance(data, Exception):
+            print(f"❌ {path.name}: {data}")
             all_valid = False
+            continue
+
+        print(f"✅ {path.name}: Valid YAML ({len(str(data))} chars)")
 
     return all_valid
 
 
-def test_complete_workflow():
+@requires_cancer_news
+@requires_enhanced_prompts
+def test_complete_workflow(cancer_api):
     """Test that all components work together."""
     print("\n" + "="*80)
     print("TEST 6: Complete Workflow Integration")
     print("="*80)
 
     try:
-        # Import main components
-        from src.ai_news_langgraph.tools_cancer_news import CancerNewsAPI
-        from src.ai_news_langgraph.prompts_enhanced import get_enhanced_prompt
-
-        # Initialize cancer news
-        api = CancerNewsAPI()
+        # Cancer news API is shared with the other tests
+        api = cancer_api
         print("✅ Cancer news API initialized")
 
         # Get enhanced prompt
@@ -313,8 +437,7 @@ def test_complete_workflow():
         print("✅ Enhanced prompt generated")
 
         # Load agent config
-        with open("src/ai_news_langgraph/config/agents/research_assistant.yaml") as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml("src/ai_news_langgraph/config/agents/research_assistant.yaml")
         print("✅ Agent config loaded")
 
         print("\n✅ All components integrate successfully!")
@@ -322,11 +445,64 @@ def test_complete_workflow():
 
     except Exception as e:
         print(f"❌ Integration test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
+class _ThreadLocalStdout(io.TextIOBase):
+    """Stdout proxy that sends writes to a per-thread buffer when one is set."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer: io.StringIO) -> None:
+        self._local.buffer = buffer
+
+    def release(self) -> None:
+        self._local.buffer = None
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+def _run_buffered(test_func, stdout: _ThreadLocalStdout):
+    """Run a test in the current thread, collecting its output separately."""
+    buffer = io.StringIO()
+    stdout.capture(buffer)
+    try:
+        result = test_func()
+    except Exception as e:
+        print(f"\n❌ Test crashed: {e}")
+        traceback.print_exc(file=buffer)
+        result = False
+    finally:
+        stdout.release()
+    return result, buffer.getvalue()
+
+
+async def main_async(tests):
+    """Run the tests concurrently in worker threads and print their output in order."""
+    stdout = _ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(_run_buffered, test_func, stdout) for _, test_func in tests)
+        )
+    finally:
+        sys.stdout = stdout._stream
+
+    results = {}
+    for (test_name, _), (result, output) in zip(tests, outcomes):
+        sys.stdout.write(output)
+        results[test_name] = result
+    return results
+
+
 def main():
     """Run all tests."""
     print("\n" + "🧪 " + "="*76)
@@ -337,21 +513,18 @@ def main():
         ("YAML Validation", test_yaml_validity),
         ("Agent Configs", test_agent_configs),
         ("Enhanced Prompts", test_enhanced_prompts),
-        ("Tools Integration", test_tools_integration),
-        ("Cancer News Sources", test_cancer_news_sources),
-        ("Complete Workflow", test_complete_workflow),
+        ("Tools Integration", lambda: test_tools_integration(_shared_news_tool())),
+        ("Cancer News Sources", lambda: test_cancer_news_sources(_shared_cancer_api())),
+        ("Complete Workflow", lambda: test_complete_workflow(_shared_cancer_api())),
     ]
 
-    results = {}
+    # Live source searches are left to the nightly job when FAST_TESTS is set
+    if os.environ.get("FAST_TESTS"):
+        print("FAST_TESTS set, skipping network-bound tests")
+        tests = [(name, func) for name, func in tests if name != "Cancer News Sources"]
 
-    for test_name, test_func in tests:
-        try:
-            results[test_name] = test_func()
-        except Exception as e:
-            print(f"\n❌ Test '{test_name}' crashed: {e}")
-            import traceback
-            traceback.print_exc()
-            results[test_name] = False
+    # Network-bound tests overlap instead of running back to back
+    results = asyncio.run(main_async(tests))
 
     # Summary
     print("\n" + "="*80)
@@ -4,108 +4,147 @@ Unit tests for WorkflowNodesV2 with mocked LLM and tools.
 
 import pytest
 import asyncio
+import copy
+import re
+from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from datetime import datetime
 
-from src.ai_news_langgraph.nodes_v2 import WorkflowNodesV2
-from src.ai_news_langgraph.state import (
-    WorkflowState,
-    ArticleModel,
-    TopicSearchResultModel
-)
+from langchain_core.language_models import FakeListChatModel
+
+from src.ai_news_langgraph.nodes_v2 import MAX_CONCURRENT_RELEVANCE_CALLS, WorkflowNodesV2
+from src.ai_news_langgraph.state import ArticleModel
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_chatopenai():
+    """Replace ChatOpenAI in nodes_v2 once for the module; tests may override it."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "src.ai_news_langgraph.nodes_v2.ChatOpenAI",
+            MagicMock(return_value=MagicMock())
+        )
+        yield
+
+
+@pytest.fixture
+def offline_outputs(tmp_path, monkeypatch):
+    """Write newsletter outputs under tmp_path with image and glossary APIs disabled."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("REPLICATE_API_TOKEN", raising=False)
+    return tmp_path
+
+
+# Keywords _extract_trends keys off, matched case-insensitively
+_TREND_RE = re.compile(r"emerging|growing|shift", re.IGNORECASE)
+
+
+@pytest.fixture(scope="module")
+def sample_articles():
+    """Validated articles shared by the module; use list(...) for a mutable copy."""
+    return tuple(
+        ArticleModel(
+            title=f"Article {i}",
+            url=f"https://example.com/{i}",
+            summary=f"Summary {i}",
+            relevance_score=0.8
+        )
+        for i in range(3)
+    )
 
 
 class TestWorkflowNodesV2:
-    """Test WorkflowNodesV2 functionality with mocks."""
-
-    @pytest.fixture
-    def mock_llm(self):
-        """Create a mock LLM."""
-        mock = MagicMock()
-        mock.ainvoke = AsyncMock()
-        return mock
-
-    @pytest.fixture
-    def mock_news_tool(self):
-        """Create a mock news search tool."""
-        mock = Mock()
-        mock.search = Mock(return_value=[
-            {
-                "title": "AI Breakthrough in Cancer",
-                "url": "https://example.com/1",
-                "content": "Amazing breakthrough...",
-                "source": "Medical News",
-                "summary": "AI achieves 95% accuracy"
-            },
-            {
-                "title": "New ML Model for Diagnosis",
-                "url": "https://example.com/2",
-                "content": "Innovative model...",
-                "source": "Research Journal",
-                "summary": "ML improves diagnosis speed"
-            }
-        ])
-        return mock
+    """Test WorkflowNodesV2 functionality with mocks.
 
-    @pytest.fixture
-    def workflow_nodes(self, mock_llm, mock_news_tool):
-        """Create WorkflowNodesV2 with mocked dependencies."""
-        with patch('src.ai_news_langgraph.nodes_v2.ChatOpenAI', return_value=mock_llm):
-            nodes = WorkflowNodesV2()
-            nodes.llm = mock_llm
-            nodes.news_tool = mock_news_tool
-            return nodes
+    LangGraph hands nodes a plain dict state, so the tests do too.
+    """
 
-    @pytest.mark.asyncio
-    async def test_initialize_workflow(self, workflow_nodes):
+    def test_initialize_workflow(self, workflow_nodes):
         """Test workflow initialization."""
-        state = WorkflowState()
-        state.topics_path = "test_config.json"
+        state = {"topics_path": "test_config.json"}
 
         # Mock config loading
-        with patch.object(workflow_nodes, '_load_topics_config') as mock_load:
+        with patch.object(workflow_nodes, 'load_topics_config') as mock_load:
             mock_load.return_value = {
                 "main_topic": "Test Topic",
                 "topics": [{"name": "Topic 1"}]
             }
 
-            result = await workflow_nodes.initialize_workflow(state)
+            result = workflow_nodes.initialize_workflow(state)
 
-            assert result.main_topic == "Test Topic"
-            assert result.current_stage == "initialized"
-            assert len(result.topics_config["topics"]) == 1
+            assert result["main_topic"] == "Test Topic"
+            assert result["current_stage"] == "initialized"
+            assert len(result["topics_config"]["topics"]) == 1
             mock_load.assert_called_once_with("test_config.json")
 
+    def test_initialize_workflow_reuses_loaded_config(self, workflow_nodes):
+        """A topics_config already in state is not loaded again."""
+        state = {"topics_config": {"main_topic": "Preloaded", "topics": [{"name": "Topic 1"}]}}
+
+        with patch.object(workflow_nodes, 'load_topics_config') as mock_load:
+            result = workflow_nodes.initialize_workflow(state)
+
+        mock_load.assert_not_called()
+        assert result["main_topic"] == "Preloaded"
+
     @pytest.mark.asyncio
-    async def test_fetch_news_for_topic(self, workflow_nodes):
+    async def test_fetch_news_for_topic(self, workflow_nodes, monkeypatch):
         """Test fetching news for a topic."""
-        state = WorkflowState()
-        state.topics_config = {
-            "topics": [
-                {
-                    "name": "AI Diagnostics",
-                    "description": "AI in medical diagnostics",
-                    "query": "AI cancer diagnosis"
-                }
-            ]
+        state = {
+            "topics_config": {
+                "topics": [
+                    {
+                        "name": "AI Diagnostics",
+                        "description": "AI in medical diagnostics",
+                        "query": "AI cancer diagnosis"
+                    }
+                ]
+            },
+            "current_topic_index": 0
         }
-        state.current_topic_index = 0
 
         # Mock relevance analysis
-        workflow_nodes._analyze_relevance = AsyncMock(return_value=0.8)
+        monkeypatch.setattr(workflow_nodes, "_analyze_relevance", AsyncMock(return_value=0.8))
 
         result = await workflow_nodes.fetch_news_for_topic(state)
 
         # Verify news was fetched
-        assert len(result.topic_results) == 1
-        assert result.topic_results[0].topic_name == "AI Diagnostics"
-        assert len(result.topic_results[0].articles) > 0
-        assert result.total_articles_fetched > 0
-        assert result.current_stage == "fetching"
+        assert len(result["topic_results"]) == 1
+        assert result["topic_results"][0]["topic_name"] == "AI Diagnostics"
+        assert len(result["topic_results"][0]["articles"]) > 0
+        assert result["total_articles_fetched"] > 0
+        assert result["current_stage"] == "fetching"
 
         # Verify news tool was called
         workflow_nodes.news_tool.search.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_fetch_bounds_relevance_calls(self, workflow_nodes, monkeypatch):
+        """Relevance scoring never has more than the configured calls in flight."""
+        state = {
+            "topics_config": {"topics": [{"name": "Topic", "description": "Test topic"}]},
+            "current_topic_index": 0
+        }
+        monkeypatch.setattr(workflow_nodes.news_tool, "search", Mock(return_value=[
+            {"title": f"Article {i}", "url": f"https://example.com/{i}"} for i in range(15)
+        ]))
+
+        in_flight = peak = 0
+
+        async def analyze(article, topic):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return 0.5
+
+        monkeypatch.setattr(workflow_nodes, "_analyze_relevance", analyze)
+
+        result = await workflow_nodes.fetch_news_for_topic(state)
+
+        assert result["total_articles_fetched"] == 10
+        assert peak == MAX_CONCURRENT_RELEVANCE_CALLS
+
     @pytest.mark.asyncio
     async def test_analyze_relevance(self, workflow_nodes, mock_llm):
         """Test article relevance analysis."""
@@ -118,50 +157,37 @@ class TestWorkflowNodesV2:
             "description": "AI in diagnostics"
         }
 
-        # Mock LLM response
-        mock_llm.ainvoke = AsyncMock(return_value="0.85")
+        mock_llm.responses = ["0.85", "not a number"]
 
-        # Need to mock the chain
-        with patch('src.ai_news_langgraph.nodes_v2.StrOutputParser') as mock_parser:
-            mock_parser.return_value = Mock()
-            score = await workflow_nodes._analyze_relevance(article, topic)
-
-            assert score == 0.5  # Default fallback in current implementation
+        assert await workflow_nodes._analyze_relevance(article, topic) == 0.85
+        # Unparseable replies fall back to a neutral score
+        assert await workflow_nodes._analyze_relevance(article, topic) == 0.5
 
     @pytest.mark.asyncio
-    async def test_summarize_topic(self, workflow_nodes, mock_llm):
+    async def test_summarize_topic(self, workflow_nodes, mock_llm, sample_articles):
         """Test topic summarization."""
         # Create state with topic results
-        state = WorkflowState()
-        articles = [
-            ArticleModel(
-                title=f"Article {i}",
-                url=f"https://example.com/{i}",
-                summary=f"Summary {i}",
-                relevance_score=0.8
-            )
-            for i in range(3)
-        ]
-
-        state.topic_results = [
-            TopicSearchResultModel(
-                topic_name="AI Diagnostics",
-                topic_description="AI in diagnostics",
-                search_query="test query",
-                articles=articles
-            )
-        ]
-        state.current_topic_index = 0
+        state = {
+            "topic_results": [
+                {
+                    "topic_name": "AI Diagnostics",
+                    "topic_description": "AI in diagnostics",
+                    "search_query": "test query",
+                    "articles": [article.model_dump() for article in sample_articles]
+                }
+            ],
+            "current_topic_index": 0
+        }
 
         # Mock LLM summary response
-        mock_llm.ainvoke = AsyncMock(return_value="""
+        mock_llm.responses = ["""
         ## Overview
         This is a comprehensive summary of AI diagnostics articles.
 
         ## Key Findings
         - Finding 1
         - Finding 2
-        """)
+        """]
 
         # Mock tool registry
         with patch.object(workflow_nodes.tool_registry, 'execute_tool') as mock_tool:
@@ -172,99 +198,87 @@ class TestWorkflowNodesV2:
 
             result = await workflow_nodes.summarize_topic(state)
 
-            assert len(result.topic_summaries) == 1
-            assert result.topic_summaries[0].topic_name == "AI Diagnostics"
-            assert result.current_topic_index == 1
-            assert result.total_topics_processed == 1
+            assert "errors" not in result
+            assert len(result["topic_summaries"]) == 1
+            assert result["topic_summaries"][0]["topic_name"] == "AI Diagnostics"
+            assert result["topic_summaries"][0]["key_findings"] == ["Key point 1", "Key point 2"]
+            assert result["current_topic_index"] == 1
+            assert result["total_topics_processed"] == 1
 
     @pytest.mark.asyncio
     async def test_review_quality(self, workflow_nodes, mock_llm):
         """Test quality review functionality."""
-        state = WorkflowState()
-        state.topic_summaries = [
-            TopicSummaryModel(
-                topic_name="Topic 1",
-                overview="This is a test summary",
-                key_findings=["Finding 1"],
-                notable_trends=["Trend 1"]
-            )
-        ]
+        state = {
+            "topic_summaries": [
+                {
+                    "topic_name": "Topic 1",
+                    "overview": "This is a test summary",
+                    "key_findings": ["Finding 1"],
+                    "notable_trends": ["Trend 1"]
+                }
+            ]
+        }
 
         # Mock LLM quality evaluation
-        mock_llm.ainvoke = AsyncMock(return_value="Quality score: 85")
-
-        # Mock tool evaluation
-        with patch.object(workflow_nodes.tool_registry, 'execute_tool') as mock_tool:
-            mock_tool.return_value = Mock(
-                success=True,
-                output={"quality_score": 0.85}
-            )
+        mock_llm.responses = ["Quality score: 85"]
 
-            result = await workflow_nodes.review_quality(state)
+        result = await workflow_nodes.review_quality(state)
 
-            assert result.current_stage == "reviewing"
-            assert "average_quality" in result.quality_reviews
-            assert result.quality_reviews["average_quality"] >= 0
+        assert result["current_stage"] == "reviewing"
+        assert result["quality_reviews"]["average_quality"] == pytest.approx(0.85)
+        assert result["topic_summaries"][0]["quality_score"] == pytest.approx(0.85)
 
     @pytest.mark.asyncio
-    async def test_generate_newsletter(self, workflow_nodes, mock_llm):
+    async def test_generate_newsletter(self, workflow_nodes, mock_llm, offline_outputs):
         """Test newsletter generation."""
-        state = WorkflowState()
-        state.topic_summaries = [
-            TopicSummaryModel(
-                topic_name="AI Diagnostics",
-                overview="Summary of AI diagnostics",
-                key_findings=["Finding 1", "Finding 2"],
-                notable_trends=["Trend 1"],
-                quality_score=0.85,
-                top_articles=[
-                    ArticleModel(
-                        title="Article 1",
-                        url="https://example.com/1"
-                    )
-                ]
-            )
-        ]
+        state = {
+            "topic_summaries": [
+                {
+                    "topic_name": "AI Diagnostics",
+                    "overview": "Summary of AI diagnostics",
+                    "key_findings": ["Finding 1", "Finding 2"],
+                    "notable_trends": ["Trend 1"],
+                    "quality_score": 0.85,
+                    "top_articles": [
+                        {"title": "Article 1", "url": "https://example.com/1"}
+                    ]
+                }
+            ],
+            "total_articles_fetched": 1
+        }
 
         # Mock LLM executive summary
-        mock_llm.ainvoke = AsyncMock(
-            return_value="This week's executive summary..."
-        )
-
-        # Mock file saving
-        with patch.object(workflow_nodes.file_manager, 'save_html') as mock_save_html, \
-             patch.object(workflow_nodes.file_manager, 'save_markdown') as mock_save_md:
+        mock_llm.responses = ["This week's executive summary..."]
 
-            result = await workflow_nodes.generate_newsletter(state)
+        result = await workflow_nodes.generate_newsletter(state)
 
-            assert result.current_stage == "completed"
-            assert result.newsletter_content is not None
-            assert result.executive_summary is not None
-            assert "html" in result.outputs
-            assert "markdown" in result.outputs
+        assert result["current_stage"] == "completed"
+        assert result["executive_summary"] == "This week's executive summary..."
+        assert "html" in result["outputs"]
 
-            # Verify files were saved
-            mock_save_html.assert_called_once()
-            mock_save_md.assert_called_once()
+        # The markdown report is written relative to the working directory
+        markdown = Path(result["outputs"]["markdown"])
+        assert markdown.is_file()
+        assert "AI Diagnostics" in markdown.read_text(encoding="utf-8")
 
     @pytest.mark.asyncio
-    async def test_error_handling_in_fetch(self, workflow_nodes):
+    async def test_error_handling_in_fetch(self, workflow_nodes, monkeypatch):
         """Test error handling in fetch_news_for_topic."""
-        state = WorkflowState()
-        state.topics_config = {"topics": [{"name": "Test"}]}
-        state.current_topic_index = 0
+        state = {
+            "topics_config": {"topics": [{"name": "Test", "description": "Test topic"}]},
+            "current_topic_index": 0
+        }
 
-        # Mock news tool to raise exception
-        workflow_nodes.news_tool.search = Mock(
-            side_effect=Exception("API Error")
+        # Mock news tool to raise exception (undone after the test)
+        monkeypatch.setattr(
+            workflow_nodes.news_tool, "search", Mock(side_effect=Exception("API Error"))
         )
 
         result = await workflow_nodes.fetch_news_for_topic(state)
 
-        assert len(result.errors) > 0
-        assert "API Error" in result.errors[0]
-        assert len(result.agent_results) == 1
-        assert result.agent_results[0].status == "failed"
+        assert len(result["errors"]) == 1
+        assert "API Error" in result["errors"][0]
+        assert "topic_results" not in result
 
     def test_extract_trends(self, workflow_nodes):
         """Test trend extraction from text."""
@@ -278,8 +292,7 @@ class TestWorkflowNodesV2:
         trends = workflow_nodes._extract_trends(text)
 
         assert len(trends) <= 3
-        assert any("emerging" in trend.lower() or "growing" in trend.lower()
-                   or "shift" in trend.lower() for trend in trends)
+        assert all(_TREND_RE.search(trend) for trend in trends)
 
     def test_generate_html_template(self, workflow_nodes):
         """Test HTML template generation."""
@@ -325,7 +338,7 @@ class TestWorkflowNodesV2:
         assert "# AI in Cancer Care Research Report" in markdown
         assert "Test executive summary" in markdown
         assert "AI Research" in markdown
-        assert "Quality Score: 90.0%" in markdown
+        assert "**Quality Score:** 90.0%" in markdown
         assert "[Article 1]" in markdown
 
 
@@ -333,44 +346,63 @@ class TestWorkflowIntegration:
     """Integration tests for complete workflow execution."""
 
     @pytest.mark.asyncio
-    async def test_full_workflow_execution(self):
+    @pytest.mark.parametrize("topic_count", [1, 3])
+    async def test_full_workflow_execution(self, offline_outputs, topic_count):
         """Test executing the full workflow with mocks."""
-        with patch('src.ai_news_langgraph.nodes_v2.ChatOpenAI'), \
-             patch('src.ai_news_langgraph.nodes_v2.NewsSearchTool'), \
+        with patch('src.ai_news_langgraph.nodes_v2.NewsSearchTool'), \
              patch('src.ai_news_langgraph.nodes_v2.FileManager'):
 
             nodes = WorkflowNodesV2()
 
             # Mock all external dependencies
+            nodes.llm = FakeListChatModel(responses=["0.9"])
             nodes.news_tool.search = Mock(return_value=[
                 {"title": "Article", "url": "https://example.com", "content": "Content"}
             ])
-            nodes.file_manager.save_html = Mock()
-            nodes.file_manager.save_markdown = Mock()
             nodes.tool_registry.execute_tool = Mock(
                 return_value=Mock(success=True, output=["Key point"])
             )
 
             # Create initial state
-            state = WorkflowState()
-            state.topics_config = {
-                "main_topic": "Test",
-                "topics": [{"name": "Topic 1", "description": "Test topic"}]
+            state = {
+                "topics_config": {
+                    "main_topic": "Test",
+                    "topics": [
+                        {"name": f"Topic {i}", "description": "Test topic"}
+                        for i in range(1, topic_count + 1)
+                    ]
+                }
             }
 
             # Execute workflow steps
-            state = await nodes.initialize_workflow(state)
-            assert state.current_stage == "initialized"
-
-            state = await nodes.fetch_news_for_topic(state)
-            assert len(state.topic_results) > 0
+            state = nodes.initialize_workflow(state)
+            assert state["current_stage"] == "initialized"
+
+            # Topics are independent, so fetch them concurrently
+            topic_states = []
+            for index in range(topic_count):
+                topic_state = copy.deepcopy(state)
+                topic_state["current_topic_index"] = index
+                topic_states.append(topic_state)
+
+            fetched = await asyncio.gather(
+                *(nodes.fetch_news_for_topic(topic_state) for topic_state in topic_states)
+            )
+            state["topic_results"] = [
+                result for topic_state in fetched for result in topic_state["topic_results"]
+            ]
+            assert [r["topic_name"] for r in state["topic_results"]] == [
+                f"Topic {i}" for i in range(1, topic_count + 1)
+            ]
 
-            state = await nodes.summarize_topic(state)
-            assert len(state.topic_summaries) > 0
+            state["current_topic_index"] = 0
+            for _ in range(topic_count):
+                state = await nodes.summarize_topic(state)
+            assert len(state["topic_summaries"]) == topic_count
 
             state = await nodes.review_quality(state)
-            assert state.quality_reviews is not None
+            assert state["quality_reviews"] is not None
 
             state = await nodes.generate_newsletter(state)
-            assert state.current_stage == "completed"
-            assert state.newsletter_content is not None
\ No newline at end of file
+            assert state["current_stage"] == "completed"
+            assert not state.get("errors")
@@ -2,9 +2,9 @@
 Unit tests for PromptRegistry and prompt management.
 """
 
+import io
 import pytest
 from unittest.mock import Mock, patch
-import tempfile
 import yaml
 
 from src.ai_news_langgraph.prompts import (
@@ -15,6 +15,18 @@ from src.ai_news_langgraph.prompts import (
 )
 
 
+# Default prompts every registry starts with, as (agent, prompt) pairs
+DEFAULT_PROMPTS = [
+    ("research_agent", "analyze_relevance"),
+    ("research_agent", "extract_key_facts"),
+    ("editor_agent", "summarize_topic"),
+    ("editor_agent", "create_executive_summary"),
+    ("chief_editor", "generate_newsletter_html"),
+    ("self_reviewer", "evaluate_quality"),
+    ("self_reviewer", "check_consistency"),
+]
+
+
 class TestPromptConfig:
     """Test PromptConfig dataclass."""
 
@@ -57,27 +69,19 @@ class TestPromptConfig:
 class TestPromptRegistry:
     """Test PromptRegistry functionality."""
 
-    @pytest.fixture
-    def registry(self):
-        """Create a fresh registry for testing."""
-        return PromptRegistry()
+    @pytest.mark.parametrize("agent_name,prompt_name", DEFAULT_PROMPTS)
+    def test_default_prompt_available(self, prompt_registry, agent_name, prompt_name):
+        """Test that each default prompt is listed, configured and compiled."""
+        assert prompt_name in prompt_registry.list_prompts()[agent_name]
 
-    def test_registry_initialization(self, registry):
-        """Test that registry initializes with default prompts."""
-        # Check that default prompts are loaded
-        prompts = registry.list_prompts()
+        config = prompt_registry.get_prompt_config(agent_name, prompt_name)
+        assert config.name == prompt_name
 
-        assert "research_agent" in prompts
-        assert "editor_agent" in prompts
-        assert "chief_editor" in prompts
-        assert "self_reviewer" in prompts
-
-        # Check specific prompts
-        research_prompts = prompts["research_agent"]
-        assert "analyze_relevance" in research_prompts
-        assert "extract_key_facts" in research_prompts
+        prompt = prompt_registry.get_prompt(agent_name, prompt_name)
+        # Check it's a ChatPromptTemplate
+        assert hasattr(prompt, 'format_messages')
 
-    def test_register_custom_prompt(self, registry):
+    def test_register_custom_prompt(self, mutable_prompt_registry):
         """Test registering a custom prompt."""
         config = PromptConfig(
             name="custom_prompt",
@@ -87,81 +91,109 @@ class TestPromptRegistry:
             variables=["data"]
         )
 
-        registry.register_prompt("test_agent", "custom_prompt", config)
+        mutable_prompt_registry.register_prompt("test_agent", "custom_prompt", config)
 
         # Verify prompt was registered
-        prompts = registry.list_prompts("test_agent")
+        prompts = mutable_prompt_registry.list_prompts("test_agent")
         assert "custom_prompt" in prompts["test_agent"]
 
         # Get the prompt
-        prompt = registry.get_prompt("test_agent", "custom_prompt")
+        prompt = mutable_prompt_registry.get_prompt("test_agent", "custom_prompt")
         assert prompt is not None
 
-    def test_get_prompt(self, registry):
-        """Test retrieving a prompt."""
-        prompt = registry.get_prompt("research_agent", "analyze_relevance")
+    def test_get_prompt_is_memoized(self, mutable_prompt_registry):
+        """Test that compiled prompts are reused until the prompt is re-registered."""
+        prompt = mutable_prompt_registry.get_prompt("research_agent", "analyze_relevance")
+        assert mutable_prompt_registry.get_prompt("research_agent", "analyze_relevance") is prompt
 
-        assert prompt is not None
-        # Check it's a ChatPromptTemplate
-        assert hasattr(prompt, 'format_messages')
+        config = mutable_prompt_registry.get_prompt_config("research_agent", "analyze_relevance")
+        mutable_prompt_registry.register_prompt("research_agent", "analyze_relevance", config)
+        reloaded = mutable_prompt_registry.get_prompt("research_agent", "analyze_relevance")
+        assert reloaded is not prompt
+
+    def test_register_invalid_template_raises(self, mutable_prompt_registry):
+        """Test that template syntax errors are reported at registration."""
+        config = PromptConfig(
+            name="broken_prompt",
+            description="Prompt with an unclosed placeholder",
+            system_template="",
+            human_template="Process: {data",
+            variables=["data"]
+        )
 
-    def test_get_nonexistent_prompt(self, registry):
+        with pytest.raises(ValueError):
+            mutable_prompt_registry.register_prompt("test_agent", "broken_prompt", config)
+
+        assert "test_agent" not in mutable_prompt_registry.list_prompts()
+
+    def test_default_configs_are_per_registry(self):
+        """Test that editing a default config does not leak into other registries."""
+        first = PromptRegistry()
+        first.get_prompt_config("research_agent", "analyze_relevance").variables.append("extra")
+
+        second = PromptRegistry()
+        assert "extra" not in second.get_prompt_config("research_agent", "analyze_relevance").variables
+
+    def test_get_nonexistent_prompt(self, prompt_registry):
         """Test getting a non-existent prompt raises error."""
         with pytest.raises(ValueError) as exc_info:
-            registry.get_prompt("nonexistent_agent", "nonexistent_prompt")
+            prompt_registry.get_prompt("nonexistent_agent", "nonexistent_prompt")
 
         assert "not found" in str(exc_info.value)
 
-    def test_get_prompt_config(self, registry):
+    def test_get_prompt_config(self, prompt_registry):
         """Test retrieving prompt configuration."""
-        config = registry.get_prompt_config("research_agent", "analyze_relevance")
+        config = prompt_registry.get_prompt_config("research_agent", "analyze_relevance")
 
         assert config.name == "analyze_relevance"
         assert config.description == "Analyze article relevance to topic"
         assert "topic_name" in config.variables
 
-    def test_list_prompts_by_agent(self, registry):
+    def test_list_prompts_by_agent(self, prompt_registry):
         """Test listing prompts filtered by agent."""
-        prompts = registry.list_prompts("editor_agent")
+        prompts = prompt_registry.list_prompts("editor_agent")
 
         assert "editor_agent" in prompts
         assert "summarize_topic" in prompts["editor_agent"]
         assert "research_agent" not in prompts
 
-    def test_load_from_yaml(self, registry):
-        """Test loading prompts from YAML file."""
-        # Create a temporary YAML file
-        yaml_content = """
-test_agent:
-  test_prompt:
-    description: "Test prompt from YAML"
-    system: "You are a test system."
-    human: "Process: {input}"
-    variables:
-      - input
-    output_format: "json"
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            yaml_path = f.name
-
-        try:
-            # Load from YAML
-            registry.load_from_yaml(yaml_path)
-
-            # Verify prompt was loaded
-            config = registry.get_prompt_config("test_agent", "test_prompt")
-            assert config.description == "Test prompt from YAML"
-            assert config.output_format == "json"
-
-        finally:
-            import os
-            os.unlink(yaml_path)
-
-    def test_compiled_prompt_format(self, registry):
+    # JSON is a subset of YAML, so the same payload exercises both loaders
+    PROMPT_FILE_CONTENT = """{
+  "test_agent": {
+    "test_prompt": {
+      "description": "Test prompt from YAML",
+      "system": "You are a test system.",
+      "human": "Process: {input}",
+      "variables": ["input"],
+      "output_format": "json"
+    }
+  }
+}"""
+
+    def test_load_from_yaml(self, mutable_prompt_registry):
+        """Test loading prompts from YAML."""
+        # Load from an in-memory stream
+        mutable_prompt_registry.load_from_yaml(io.StringIO(self.PROMPT_FILE_CONTENT))
+
+        # Verify prompt was loaded
+        config = mutable_prompt_registry.get_prompt_config("test_agent", "test_prompt")
+        assert config.description == "Test prompt from YAML"
+        assert config.output_format == "json"
+
+    def test_load_from_json_file(self, mutable_prompt_registry, tmp_path):
+        """Test that .json prompt files are parsed as JSON."""
+        json_path = tmp_path / "prompts.json"
+        json_path.write_text(self.PROMPT_FILE_CONTENT)
+
+        mutable_prompt_registry.load_from_yaml(json_path)
+
+        config = mutable_prompt_registry.get_prompt_config("test_agent", "test_prompt")
+        assert config.variables == ["input"]
+        assert config.output_format == "json"
+
+    def test_compiled_prompt_format(self, prompt_registry):
         """Test that compiled prompts have correct format."""
-        prompt = registry.get_prompt("research_agent", "analyze_relevance")
+        prompt = prompt_registry.get_prompt("research_agent", "analyze_relevance")
 
         # Test formatting with variables
         messages = prompt.format_messages(
@@ -179,16 +211,20 @@ class TestPromptOptimizer:
     """Test PromptOptimizer functionality."""
 
     @pytest.fixture
-    def optimizer(self):
-        """Create optimizer with registry."""
-        registry = PromptRegistry()
-        return PromptOptimizer(registry)
+    def optimizer(self, prompt_registry):
+        """Create optimizer over the shared prompt_registry."""
+        return PromptOptimizer(prompt_registry)
+
+    @pytest.fixture
+    def mutable_optimizer(self, mutable_prompt_registry):
+        """Create optimizer over a fresh prompt_registry it may modify."""
+        return PromptOptimizer(mutable_prompt_registry)
 
     def test_optimizer_initialization(self, optimizer):
         """Test optimizer initializes correctly."""
         assert optimizer.registry is not None
 
-    def test_add_few_shot_examples(self, optimizer):
+    def test_add_few_shot_examples(self, mutable_optimizer):
         """Test adding few-shot examples to a prompt."""
         examples = [
             {
@@ -201,14 +237,14 @@ class TestPromptOptimizer:
             }
         ]
 
-        optimizer.add_few_shot_examples(
+        mutable_optimizer.add_few_shot_examples(
             "research_agent",
             "analyze_relevance",
             examples
         )
 
         # Verify examples were added
-        config = optimizer.registry.get_prompt_config(
+        config = mutable_optimizer.registry.get_prompt_config(
             "research_agent",
             "analyze_relevance"
         )
@@ -232,7 +268,7 @@ class TestPromptOptimizer:
 
 
 class TestGlobalRegistry:
-    """Test global registry and convenience functions."""
+    """Test global prompt_registry and convenience functions."""
 
     def test_global_get_prompt(self):
         """Test using the global get_prompt function."""
@@ -252,14 +288,9 @@ class TestGlobalRegistry:
 class TestPromptContent:
     """Test the actual content of key prompts."""
 
-    @pytest.fixture
-    def registry(self):
-        """Create a registry for testing."""
-        return PromptRegistry()
-
-    def test_research_agent_prompts(self, registry):
+    def test_research_agent_prompts(self, prompt_registry):
         """Test research agent prompt content."""
-        config = registry.get_prompt_config("research_agent", "analyze_relevance")
+        config = prompt_registry.get_prompt_config("research_agent", "analyze_relevance")
 
         # Check system template
         assert "AI Research Analyst" in config.system_template
@@ -270,9 +301,9 @@ class TestPromptContent:
         assert "{topic_name}" in config.human_template
         assert "0.0 and 1.0" in config.human_template
 
-    def test_editor_agent_prompts(self, registry):
+    def test_editor_agent_prompts(self, prompt_registry):
         """Test editor agent prompt content."""
-        config = registry.get_prompt_config("editor_agent", "summarize_topic")
+        config = prompt_registry.get_prompt_config("editor_agent", "summarize_topic")
 
         # Check role definition
         assert "Medical Editor" in config.system_template
@@ -283,9 +314,9 @@ class TestPromptContent:
         assert "Key Findings" in config.human_template
         assert "200-250 word" in config.human_template
 
-    def test_self_reviewer_prompts(self, registry):
+    def test_self_reviewer_prompts(self, prompt_registry):
         """Test self-reviewer prompt content."""
-        config = registry.get_prompt_config("self_reviewer", "evaluate_quality")
+        config = prompt_registry.get_prompt_config("self_reviewer", "evaluate_quality")
 
         # Check quality criteria
         assert "Quality Assurance" in config.system_template
@@ -302,22 +333,22 @@ class TestPromptPerformance:
         """Test that prompt compilation is fast."""
         import time
 
-        registry = PromptRegistry()
+        prompt_registry = PromptRegistry()
         start = time.time()
 
         # Get 100 prompts
         for _ in range(100):
-            prompt = registry.get_prompt("research_agent", "analyze_relevance")
+            prompt = prompt_registry.get_prompt("research_agent", "analyze_relevance")
 
         elapsed = time.time() - start
         assert elapsed < 0.1  # Should be very fast due to caching
 
     def test_registry_initialization_speed(self):
-        """Test that registry initialization is reasonable."""
+        """Test that prompt_registry initialization is reasonable."""
         import time
 
         start = time.time()
-        registry = PromptRegistry()
+        prompt_registry = PromptRegistry()
         elapsed = time.time() - start
 
         assert elapsed < 1.0  # Should initialize in under 1 second
\ No newline at end of file
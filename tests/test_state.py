@@ -4,7 +4,6 @@ Unit tests for WorkflowState and related models.
 
 import pytest
 from datetime import datetime
-from pydantic import ValidationError
 
 from src.ai_news_langgraph.state_base import (
     WorkflowState,
@@ -12,7 +11,9 @@ from src.ai_news_langgraph.state_base import (
     TopicSearchResultModel,
     TopicSummaryModel,
     AgentTaskResultModel,
-    NewsletterContentModel
+    NewsletterContentModel,
+    ValidationError,
+    MAX_STATE_MESSAGES
 )
 
 
@@ -52,6 +53,15 @@ class TestArticleModel:
                 relevance_score=1.5  # > 1.0
             )
 
+        # Numeric strings (e.g. parsed LLM output) are coerced; other text is rejected
+        assert ArticleModel(title="Test", url="https://example.com", relevance_score="0.8").relevance_score == 0.8
+        with pytest.raises(ValidationError):
+            ArticleModel(title="Test", url="https://example.com", relevance_score="high")
+
+        # Only model validation failures are ValidationErrors
+        assert issubclass(ValidationError, ValueError)
+        assert not isinstance(ValueError("other"), ValidationError)
+
     def test_article_optional_fields(self):
         """Test article with minimal required fields."""
         article = ArticleModel(
@@ -64,26 +74,31 @@ class TestArticleModel:
         assert article.summary is None
         assert article.relevance_score is None
 
+    def test_article_minimal(self):
+        """Test the title+url shortcut matches the keyword constructor."""
+        article = ArticleModel.minimal("Minimal Article", "https://example.com")
+
+        assert article == ArticleModel(
+            title="Minimal Article",
+            url="https://example.com"
+        )
+
 
 class TestTopicSearchResultModel:
     """Test TopicSearchResultModel functionality."""
 
-    def test_topic_search_result_creation(self):
+    def test_topic_search_result_creation(self, sample_articles):
         """Test creating a topic search result."""
-        articles = [
-            ArticleModel(title="Article 1", url="https://example.com/1"),
-            ArticleModel(title="Article 2", url="https://example.com/2")
-        ]
-
         result = TopicSearchResultModel(
             topic_name="AI Diagnostics",
             topic_description="AI in medical diagnostics",
             search_query="AI cancer diagnosis",
-            articles=articles
+            articles=list(sample_articles)
         )
 
         assert result.topic_name == "AI Diagnostics"
         assert len(result.articles) == 2
+        assert result.articles[0].relevance_score == 0.9
         assert result.search_timestamp is not None
 
     def test_empty_articles_list(self):
@@ -97,6 +112,25 @@ class TestTopicSearchResultModel:
         assert result.articles == []
         assert isinstance(result.search_timestamp, datetime)
 
+    def test_fast_create(self):
+        """Test building a result from trusted data without validation."""
+        articles = [ArticleModel(title="Article 1", url="https://example.com/1")]
+        result = TopicSearchResultModel.fast_create(
+            topic_name="AI Diagnostics",
+            topic_description="AI in medical diagnostics",
+            search_query="AI cancer diagnosis",
+            articles=articles
+        )
+
+        assert result == TopicSearchResultModel(
+            topic_name="AI Diagnostics",
+            topic_description="AI in medical diagnostics",
+            search_query="AI cancer diagnosis",
+            articles=articles,
+            search_timestamp=result.search_timestamp
+        )
+        assert result.articles[0] is articles[0]
+
 
 class TestAgentTaskResultModel:
     """Test AgentTaskResultModel functionality."""
@@ -130,6 +164,26 @@ class TestAgentTaskResultModel:
         assert result.error == "API rate limit exceeded"
         assert result.output is None
 
+    def test_numeric_fields_are_checked(self):
+        """Test that numeric fields are coerced or rejected."""
+        result = AgentTaskResultModel(
+            task_name="test",
+            agent_name="test_agent",
+            status="success",
+            execution_time="1.5",
+            retry_count="2"
+        )
+        assert result.execution_time == 1.5
+        assert result.retry_count == 2
+
+        with pytest.raises(ValidationError):
+            AgentTaskResultModel(
+                task_name="test",
+                agent_name="test_agent",
+                status="success",
+                execution_time="slow"
+            )
+
     def test_invalid_status(self):
         """Test that invalid status raises validation error."""
         with pytest.raises(ValidationError):
@@ -151,7 +205,7 @@ class TestWorkflowState:
         assert state.current_stage == "initialized"
         assert state.current_topic_index == 0
         assert state.topic_results == []
-        assert state.errors == []
+        assert list(state.errors) == []
         assert isinstance(state.thread_id, str)
 
     def test_add_error(self):
@@ -163,6 +217,34 @@ class TestWorkflowState:
         assert "Test error message" in state.errors[0]
         assert datetime.now().isoformat()[:10] in state.errors[0]  # Check date
 
+    def test_extend_errors(self):
+        """Test that batched errors match per-call add_error output."""
+        single = WorkflowState()
+        for message in ("First error", "Second error"):
+            single.add_error(message)
+
+        batched = WorkflowState()
+        batched.extend_errors(["First error", "Second error"])
+
+        assert len(batched.errors) == 2
+        # Same "[timestamp] message" shape; compare the message parts
+        assert [e.split("] ", 1)[1] for e in batched.errors] == \
+            [e.split("] ", 1)[1] for e in single.errors]
+        assert batched.errors[0].startswith("[" + datetime.now().isoformat()[:10])
+
+    def test_errors_are_bounded(self):
+        """Test that only the most recent errors are kept."""
+        state = WorkflowState()
+        state.extend_errors(f"Error {i}" for i in range(MAX_STATE_MESSAGES + 5))
+
+        assert len(state.errors) == MAX_STATE_MESSAGES
+        assert state.errors[0].endswith("Error 5")
+        assert state.model_dump()["errors"] == list(state.errors)
+
+        # History rebuilt from a dump stays bounded
+        restored = WorkflowState(**state.model_dump())
+        assert restored.errors.maxlen == MAX_STATE_MESSAGES
+
     def test_add_warning(self):
         """Test adding warnings to state."""
         state = WorkflowState()
@@ -200,6 +282,25 @@ class TestWorkflowState:
         assert len(remaining) == 2
         assert remaining[0]["name"] == "Topic 2"
 
+        # Reassigned and edited configs are both reflected
+        state.topics_config = {"topics": [{"name": "Topic A"}, {"name": "Topic B"}]}
+        assert [t["name"] for t in state.get_remaining_topics()] == ["Topic B"]
+
+        state.topics_config["topics"].append({"name": "Topic C"})
+        assert [t["name"] for t in state.get_remaining_topics()] == ["Topic B", "Topic C"]
+
+    def test_remaining_topics_advance(self, sample_workflow_state):
+        """Test that remaining topics follow the topic index."""
+        state = sample_workflow_state
+        assert [t["name"] for t in state.get_remaining_topics()] == ["Diagnostics", "Treatment"]
+
+        state.current_topic_index = 1
+        assert [t["name"] for t in state.get_remaining_topics()] == ["Treatment"]
+
+        # The fixture hands out a deep copy, so this edit stays in this test
+        state.topics_config["topics"].pop()
+        assert state.get_remaining_topics() == []
+
     def test_is_complete(self):
         """Test completion checking."""
         state = WorkflowState()
@@ -238,9 +339,47 @@ class TestWorkflowState:
         assert metrics["total_articles"] == 25
         assert metrics["topics_processed"] == 3
         assert metrics["success_rate"] == 0.5  # 1 success, 1 failed
+        assert metrics["failed_tasks"] == 1
         assert metrics["errors_count"] == 0
         assert "duration_seconds" in metrics
 
+        # New results are picked up on the next call
+        state.add_agent_result(AgentTaskResultModel(
+            task_name="task3",
+            agent_name="agent3",
+            status="success"
+        ))
+        assert state.calculate_metrics()["success_rate"] == pytest.approx(2 / 3)
+
+    def test_calculate_metrics_follows_result_changes(self):
+        """Metrics reflect copied and edited agent results."""
+        state = WorkflowState()
+        state.add_agent_result(AgentTaskResultModel(
+            task_name="task1",
+            agent_name="agent1",
+            status="success"
+        ))
+        assert state.calculate_metrics()["success_rate"] == 1.0
+
+        # A copy with replaced results is counted from its own list
+        copied = state.model_copy(update={"agent_results": [
+            AgentTaskResultModel(task_name="task2", agent_name="agent2", status="failed")
+        ]})
+        copied_metrics = copied.calculate_metrics()
+        assert copied_metrics["success_rate"] == 0.0
+        assert copied_metrics["failed_tasks"] == 1
+
+        # An in-place status change is picked up on the next call
+        pending = AgentTaskResultModel(
+            task_name="task3",
+            agent_name="agent3",
+            status="in_progress"
+        )
+        state.add_agent_result(pending)
+        assert state.calculate_metrics()["success_rate"] == 0.5
+        pending.status = "success"
+        assert state.calculate_metrics()["success_rate"] == 1.0
+
 
 class TestTopicSummaryModel:
     """Test TopicSummaryModel functionality."""
@@ -288,9 +427,9 @@ class TestNewsletterContentModel:
 
 
 # Fixtures for testing
-@pytest.fixture
-def sample_workflow_state():
-    """Create a sample workflow state for testing."""
+@pytest.fixture(scope="module")
+def _base_workflow_state():
+    """Build the sample workflow state once per module."""
     state = WorkflowState()
     state.topics_config = {
         "main_topic": "AI in Cancer Care",
@@ -303,9 +442,16 @@ def sample_workflow_state():
 
 
 @pytest.fixture
+def sample_workflow_state(_base_workflow_state):
+    """Create a sample workflow state for testing."""
+    # State is mutable, so each test gets its own deep copy
+    return _base_workflow_state.model_copy(deep=True)
+
+
+@pytest.fixture(scope="module")
 def sample_articles():
-    """Create sample articles for testing."""
-    return [
+    """Create sample articles for testing; use list(...) for a mutable copy."""
+    return (
         ArticleModel(
             title="Article 1",
             url="https://example.com/1",
@@ -316,4 +462,4 @@ def sample_articles():
             url="https://example.com/2",
             relevance_score=0.7
         )
-    ]
\ No newline at end of file
+    )
@@ -4,14 +4,9 @@ Generate visual representations of the LangGraph workflow.
 Creates both a graph diagram and a flow chart.
 """
 
-import os
-from pathlib import Path
 
-
-def create_graphviz_workflow():
-    """Create a Graphviz DOT representation of the workflow."""
-
-    dot_content = """
+# Graphviz DOT source for the workflow graph
+_GRAPHVIZ_DOT = """
 digraph AINewsWorkflow {
     rankdir=TB;
     node [shape=box, style="rounded,filled", fontname="Arial"];
@@ -70,13 +65,14 @@ digraph AINewsWorkflow {
 }
     """
 
-    return dot_content
 
+def create_graphviz_workflow():
+    """Create a Graphviz DOT representation of the workflow."""
+    return _GRAPHVIZ_DOT
 
-def create_mermaid_workflow():
-    """Create a Mermaid diagram of the workflow."""
 
-    mermaid_content = """
+# Mermaid flowchart of the workflow
+_MERMAID_WORKFLOW = """
 graph TD
     %% Main Workflow
     Start([Start]) --> Init[Initialize Workflow]
@@ -117,13 +113,14 @@ graph TD
     class SaveHTML,SaveMD,SaveJSON output
     """
 
-    return mermaid_content
 
+def create_mermaid_workflow():
+    """Create a Mermaid diagram of the workflow."""
+    return _MERMAID_WORKFLOW
 
-def create_state_flow_diagram():
-    """Create a diagram showing state evolution through the workflow."""
 
-    state_diagram = """
+# Mermaid state diagram of the workflow stages
+_STATE_DIAGRAM = """
 stateDiagram-v2
     [*] --> Initialized: Start Workflow
 
@@ -168,32 +165,33 @@ stateDiagram-v2
     end note
     """
 
-    return state_diagram
+
+def create_state_flow_diagram():
+    """Create a diagram showing state evolution through the workflow."""
+    return _STATE_DIAGRAM
 
 
 def save_diagrams():
     """Save all diagrams to files."""
 
+    from pathlib import Path
+
     output_dir = Path("docs/diagrams")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Save Graphviz DOT file
+    # Each diagram is generated once and reused for the README below
     dot_content = create_graphviz_workflow()
-    dot_file = output_dir / "workflow.dot"
-    dot_file.write_text(dot_content)
-    print(f"✅ Saved Graphviz diagram to {dot_file}")
-
-    # Save Mermaid diagram
     mermaid_content = create_mermaid_workflow()
-    mermaid_file = output_dir / "workflow.mmd"
-    mermaid_file.write_text(mermaid_content)
-    print(f"✅ Saved Mermaid diagram to {mermaid_file}")
-
-    # Save state diagram
     state_content = create_state_flow_diagram()
-    state_file = output_dir / "state_flow.mmd"
-    state_file.write_text(state_content)
-    print(f"✅ Saved State diagram to {state_file}")
+
+    files = [
+        (output_dir / "workflow.dot", dot_content, "Graphviz diagram"),
+        (output_dir / "workflow.mmd", mermaid_content, "Mermaid diagram"),
+        (output_dir / "state_flow.mmd", state_content, "State diagram"),
+    ]
+    for path, content, label in files:
+        path.write_bytes(content.encode("utf-8"))
+        print(f"✅ Saved {label} to {path}")
 
     # Create README with all diagrams
     readme_content = f"""# AI News LangGraph Workflow Diagrams
@@ -234,7 +232,7 @@ Use the provided `workflow_visualization.ipynb` for interactive visualization.
 """
 
     readme_file = output_dir / "README.md"
-    readme_file.write_text(readme_content)
+    readme_file.write_bytes(readme_content.encode("utf-8"))
     print(f"✅ Saved README to {readme_file}")
 
 
@@ -246,10 +244,13 @@ def generate_png_with_graphviz():
         dot_file = "docs/diagrams/workflow.dot"
         png_file = "docs/diagrams/workflow.png"
 
+        # Only stderr is reported, so stdout is discarded rather than buffered
         result = subprocess.run(
             ["dot", "-Tpng", dot_file, "-o", png_file],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False
         )
 
         if result.returncode == 0:
@@ -265,63 +266,19 @@ def generate_png_with_graphviz():
 
 def print_ascii_workflow():
     """Print a simple ASCII representation of the workflow."""
-
-    ascii_workflow = """
-    ┌─────────────────────────────────────────────────────────┐
-    │                 AI News LangGraph Workflow              │
-    └─────────────────────────────────────────────────────────┘
-
-                            ┌──────┐
-                            │START │
-                            └───┬──┘
-                                │
-                        ┌───────▼────────┐
-                        │   Initialize   │
-                        │    Workflow    │
-                        └───────┬────────┘
-                                │
-                ┌───────────────▼────────────────┐
-                │         Fetch News             │
-                │   (for current topic)          │
-                └───────────────┬────────────────┘
-                                │
-                        ┌───────▼────────┐
-                        │   Summarize    │
-                        │     Topic      │
-                        └───────┬────────┘
-                                │
-                          ┌─────▼─────┐
-                          │   More    │
-                      ┌───│  Topics?  │───┐
-                      │   └───────────┘   │
-                      │Yes                │No
-                      │                   │
-                      └──────────┐        │
-                                 │        │
-                         ┌───────▼────────▼─┐
-                         │  Review Quality  │
-                         │  (Self-Reviewer) │
-                         └────────┬─────────┘
-                                  │
-                         ┌────────▼─────────┐
-                         │    Generate      │
-                         │   Newsletter     │
-                         └────────┬─────────┘
-                                  │
-                    ┌─────────────┼─────────────┐
-                    │             │             │
-              ┌─────▼────┐ ┌─────▼────┐ ┌─────▼────┐
-              │   HTML   │ │Markdown  │ │   JSON   │
-              └──────────┘ └──────────┘ └──────────┘
-                    │             │             │
-                    └─────────────┼─────────────┘
-                                  │
-                             ┌────▼────┐
-                             │   END   │
-                             └─────────┘
-    """
-
-    print(ascii_workflow)
+    import sys
+    from pathlib import Path
+
+    # The art lives in docs/diagrams/workflow.ascii and is written out as-is
+    ascii_workflow = (Path(__file__).parent / "docs" / "diagrams" / "workflow.ascii").read_bytes()
+
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        buffer.write(ascii_workflow)
+        buffer.flush()
+    else:
+        sys.stdout.write(ascii_workflow.decode("utf-8"))
 
 
 def main():